@@ -3,7 +3,14 @@ from flask_cors import CORS
 from flask_jwt_extended import JWTManager
 from backend.config import Config
 from backend.model import db
+from backend.engine import init_sqlite_profile
+from backend.routing import configure_read_engine
 from backend.routes import api_bp
+from backend.search import ensure_search_index
+from backend.invalidation import init_cache_invalidation
+from backend.warmup import warm_cache, warm_cache_on_start, WARMUP_TARGETS
+from backend.cache import invalidate_cache_prefix
+import click
 import logging
 
 # Configure logging
@@ -25,19 +32,30 @@ CORS(app, resources={
     }
 })
 jwt = JWTManager(app)
+
+# Add the read engine used by read-only resource methods, then create the engines
+configure_read_engine(app)
 db.init_app(app)
 
+# Apply the SQLite connection profile (WAL, busy timeout, cache sizes) to every connection
+init_sqlite_profile(app, db)
+
+# Invalidate cached responses automatically when their rows are committed
+init_cache_invalidation(db)
+
 # Register blueprints
 app.register_blueprint(api_bp)
 
 # Initialize Redis cache (indirectly)
 with app.app_context():
     try:
-        from backend.cache import REDIS_AVAILABLE
-        if REDIS_AVAILABLE:
+        from backend.cache import connect_redis, REDIS_ENABLED
+        if not REDIS_ENABLED:
+            logger.info("Redis is disabled - using the in-memory cache only")
+        elif connect_redis():
             logger.info("Redis cache initialized successfully")
         else:
-            logger.warning("Redis cache is not available - caching is disabled")
+            logger.warning("Redis cache is not available - using the in-memory cache and reconnecting in the background")
     except ImportError:
         logger.warning("Redis cache module could not be imported")
 
@@ -70,6 +88,20 @@ def handle_error(e):
 # Create all database tables
 with app.app_context():
     db.create_all()
+    # Full-text search index for service requests (SQLite FTS5)
+    ensure_search_index(app)
+
+@app.cli.command('warm-cache')
+@click.option('--refresh', is_flag=True, help='Invalidate the warmed endpoints first and recompute them')
+def warm_cache_command(refresh):
+    """Precompute the cached responses of the read-mostly endpoints"""
+    if refresh:
+        for resource, _ in WARMUP_TARGETS:
+            invalidate_cache_prefix(resource.get.cache_prefix)
+    for path, status in warm_cache(app).items():
+        click.echo(f"{path}: {status}")
 
 if __name__ == "__main__":
+    # Precompute read-mostly responses so the first users after a restart hit a warm cache
+    warm_cache_on_start(app, use_reloader=True)
     app.run(debug=True) 
\ No newline at end of file
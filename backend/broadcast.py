@@ -0,0 +1,123 @@
+import logging
+import threading
+from collections import defaultdict
+
+logger = logging.getLogger(__name__)
+
+class InProcessBroker:
+    """
+    Broker delivering messages synchronously to subscribers in this process.
+
+    Stands in for Redis pub/sub in tests and single-process setups; every
+    subscriber, including the publisher's own, receives each message.
+    """
+
+    def __init__(self):
+        self._subscribers = defaultdict(list)
+        self._lock = threading.Lock()
+
+    @property
+    def connected(self):
+        return True
+
+    def publish(self, channel, message):
+        with self._lock:
+            handlers = list(self._subscribers[channel])
+        for handler in handlers:
+            handler(message)
+
+    def subscribe(self, channel, handler, on_connect=None):
+        with self._lock:
+            self._subscribers[channel].append(handler)
+        if on_connect:
+            on_connect()
+
+    def close(self):
+        with self._lock:
+            self._subscribers.clear()
+
+class RedisBroker:
+    """
+    Redis pub/sub broker.
+
+    Messages are published through the shared (circuit-breaker guarded) client.
+    Each subscription gets a daemon thread with its own connection, which
+    resubscribes with exponential backoff after the connection is lost and
+    calls on_connect every time the subscription is (re)established, since
+    messages published in between are lost.
+    """
+
+    def __init__(self, publisher, subscriber_factory, reconnect_delay=1.0, max_reconnect_delay=30.0):
+        """
+        Args:
+            publisher: Redis client used to publish
+            subscriber_factory: Callable returning a new Redis client for a subscription
+            reconnect_delay (float): Seconds before the first resubscription attempt
+            max_reconnect_delay (float): Upper bound of the resubscription backoff
+        """
+        self.publisher = publisher
+        self.subscriber_factory = subscriber_factory
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self._subscriptions = 0
+        self._connected = 0
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    @property
+    def connected(self):
+        """True while every subscription is listening"""
+        return self._subscriptions > 0 and self._connected == self._subscriptions
+
+    def publish(self, channel, message):
+        self.publisher.publish(channel, message)
+
+    def subscribe(self, channel, handler, on_connect=None):
+        with self._lock:
+            self._subscriptions += 1
+        thread = threading.Thread(
+            target=self._listen, args=(channel, handler, on_connect),
+            name=f"redis-subscriber-{channel}", daemon=True
+        )
+        thread.start()
+
+    def close(self):
+        self._stopped.set()
+
+    def _listen(self, channel, handler, on_connect):
+        delay = self.reconnect_delay
+        while not self._stopped.is_set():
+            pubsub = None
+            connected = False
+            try:
+                pubsub = self.subscriber_factory().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(channel)
+                with self._lock:
+                    self._connected += 1
+                connected = True
+                delay = self.reconnect_delay
+                logger.info(f"Subscribed to Redis channel '{channel}'")
+                if on_connect:
+                    on_connect()
+
+                while not self._stopped.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message['type'] == 'message':
+                        try:
+                            handler(message['data'])
+                        except Exception as e:
+                            logger.warning(f"Error handling message on '{channel}': {e}")
+            except Exception as e:
+                logger.debug(f"Redis subscription to '{channel}' lost: {e}")
+            finally:
+                if connected:
+                    with self._lock:
+                        self._connected -= 1
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+            self._stopped.wait(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
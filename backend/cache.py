@@ -1,11 +1,23 @@
 import json
 import functools
+import hashlib
 import redis
-from datetime import timedelta, datetime
+from datetime import timedelta
 import logging
 import time
 import os
 import socket
+import threading
+import uuid
+import struct
+from collections import OrderedDict
+from flask import Response, request, has_request_context, current_app
+from flask_jwt_extended import get_jwt, get_jwt_identity
+from backend.codec import DateTimeEncoder, encode_json, payload_codec
+from backend.metrics import CacheMetrics
+from backend.redis_pool import RedisCircuitBreaker, GuardedRedis
+from backend.broadcast import InProcessBroker, RedisBroker
+from backend.routing import read_from_replica
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -18,176 +30,816 @@ REDIS_ENABLED = os.environ.get('ENABLE_REDIS', 'true').lower() == 'true'
 REDIS_HOST = os.environ.get('REDIS_HOST', 'localhost')
 REDIS_PORT = int(os.environ.get('REDIS_PORT', 6379))
 
-# Initialize Redis client with error handling
-REDIS_AVAILABLE = False
+# Connection pool and circuit breaker settings. Timeouts are short so that an
+# unresponsive Redis costs little before the breaker opens.
+REDIS_MAX_CONNECTIONS = int(os.environ.get('REDIS_MAX_CONNECTIONS', 50))
+REDIS_SOCKET_TIMEOUT = float(os.environ.get('REDIS_SOCKET_TIMEOUT', 0.5))
+REDIS_HEALTH_CHECK_INTERVAL = int(os.environ.get('REDIS_HEALTH_CHECK_INTERVAL', 30))
+REDIS_FAILURE_THRESHOLD = int(os.environ.get('REDIS_FAILURE_THRESHOLD', 3))
+REDIS_RESET_TIMEOUT = float(os.environ.get('REDIS_RESET_TIMEOUT', 1))
+REDIS_MAX_RESET_TIMEOUT = float(os.environ.get('REDIS_MAX_RESET_TIMEOUT', 30))
+
+def _connection_pool(decode_responses):
+    """Bounded pool; callers wait up to the socket timeout for a free connection"""
+    return redis.BlockingConnectionPool(
+        host=REDIS_HOST,
+        port=REDIS_PORT,
+        db=0,
+        decode_responses=decode_responses,
+        max_connections=REDIS_MAX_CONNECTIONS,
+        timeout=REDIS_SOCKET_TIMEOUT,
+        socket_timeout=REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+        health_check_interval=REDIS_HEALTH_CHECK_INTERVAL
+    )
+
+# Try to detect if running in WSL
+hostname = socket.gethostname()
+is_wsl = "WSL" in hostname or "wsl" in hostname or os.path.exists("/proc/sys/fs/binfmt_misc/WSLInterop")
+
+if REDIS_ENABLED and is_wsl:
+    logger.info(f"WSL environment detected, using '{REDIS_HOST}:{REDIS_PORT}' for Redis")
+
+_redis_text_client = redis.Redis(connection_pool=_connection_pool(decode_responses=True))
+
+# Every Redis call goes through the breaker; it starts open and closes once a
+# background probe reaches Redis, so a Redis started later is picked up too
+redis_breaker = RedisCircuitBreaker(
+    probe=_redis_text_client.ping,
+    failure_threshold=REDIS_FAILURE_THRESHOLD,
+    reset_timeout=REDIS_RESET_TIMEOUT,
+    max_reset_timeout=REDIS_MAX_RESET_TIMEOUT,
+    on_close=lambda: _sync_pending_invalidations()
+)
+redis_client = GuardedRedis(_redis_text_client, redis_breaker)
+# Cached payloads are binary, so they go through a client without response decoding
+redis_bytes_client = GuardedRedis(
+    redis.Redis(connection_pool=_connection_pool(decode_responses=False)),
+    redis_breaker
+)
+
 if REDIS_ENABLED:
-    try:
-        # Try to detect if running in WSL
-        hostname = socket.gethostname()
-        is_wsl = "WSL" in hostname or "wsl" in hostname or os.path.exists("/proc/sys/fs/binfmt_misc/WSLInterop")
-        
-        if is_wsl:
-            logger.info(f"WSL environment detected, using '{REDIS_HOST}:{REDIS_PORT}' for Redis")
-        
-        redis_client = redis.Redis(
-            host=REDIS_HOST, 
-            port=REDIS_PORT, 
-            db=0, 
-            decode_responses=True, 
-            socket_timeout=2,
-            socket_connect_timeout=2
-        )
-        redis_client.ping()  # Test connection
-        REDIS_AVAILABLE = True
-        logger.info(f"Redis connection established to {REDIS_HOST}:{REDIS_PORT}")
-    except (redis.ConnectionError, redis.exceptions.ConnectionError, redis.exceptions.TimeoutError) as e:
-        logger.warning(f"Redis connection failed: {e}. Caching will be disabled.")
+    redis_breaker.start()
 else:
     logger.info("Redis is disabled by configuration")
 
-# Simple in-memory cache for fallback when Redis is not available
-memory_cache = {}
-memory_cache_expiry = {}
+def redis_available():
+    """Return True if Redis is enabled and its circuit is closed"""
+    return REDIS_ENABLED and redis_breaker.allow()
+
+def connect_redis():
+    """
+    Check the Redis connection synchronously, e.g. at startup.
+    
+    Returns:
+        bool: True if Redis is reachable; otherwise it keeps being probed in the background
+    """
+    if not REDIS_ENABLED:
+        return False
+    _ensure_subscribed()
+    if redis_breaker.probe():
+        logger.info(f"Redis connection established to {REDIS_HOST}:{REDIS_PORT}")
+        return True
+    logger.warning(f"Redis connection failed: {redis_breaker.last_error}. Using the memory cache until it is reachable.")
+    redis_breaker.start()
+    return False
+
+# Invalidations are broadcast to every worker's memory tier: 'redis' (pub/sub),
+# 'memory' (in-process, for tests and single-process setups) or 'none'
+CACHE_INVALIDATION_BROKER = os.environ.get('CACHE_INVALIDATION_BROKER', 'redis' if REDIS_ENABLED else 'none')
+INVALIDATION_CHANNEL = 'cache:invalidations'
+# Identifies this process as the origin of the invalidations it broadcasts
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+def _subscriber_client():
+    # Dedicated connection without a read timeout; the listener polls with its own timeout
+    return redis.Redis(
+        host=REDIS_HOST,
+        port=REDIS_PORT,
+        db=0,
+        decode_responses=True,
+        socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+        health_check_interval=REDIS_HEALTH_CHECK_INTERVAL
+    )
+
+def _create_broker(name):
+    if name == 'redis':
+        return RedisBroker(redis_client, _subscriber_client, REDIS_RESET_TIMEOUT, REDIS_MAX_RESET_TIMEOUT)
+    if name == 'memory':
+        return InProcessBroker()
+    return None
+
+invalidation_broker = _create_broker(CACHE_INVALIDATION_BROKER)
+_subscribed_pid = None
+_subscribe_lock = threading.Lock()
+
+# Bounds of the in-process cache tier
+MEMORY_CACHE_MAX_ENTRIES = int(os.environ.get('MEMORY_CACHE_MAX_ENTRIES', 1000))
+MEMORY_CACHE_MAX_BYTES = int(os.environ.get('MEMORY_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+
+# Namespace generations for O(1) invalidation. Every ':'-separated prefix of a
+# key (e.g. "services", "services:detail", "services:detail:5") is a namespace;
+# bumping a namespace's generation changes the stored key of every entry under
+# it, so old entries are never read again and simply expire by TTL.
+GENERATION_KEY_PREFIX = 'cache:generation:'
+# Generations outlive every cache entry, so an expired generation can never
+# make an old entry readable again
+GENERATION_TTL = 7 * 24 * 3600
+local_generations = {}
+# When this process last invalidated a namespace or received another
+# worker's invalidation, i.e. when the database was last written
+_last_invalidation = 0.0
 
-# Custom JSON encoder to handle datetime objects
-class DateTimeEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return super().default(obj)
+# Stampede protection: seconds an expired entry may still be served while one
+# caller refreshes it, and the single-flight lock settings
+STALE_GRACE = int(os.environ.get('CACHE_STALE_GRACE', 60))
+LOCK_KEY_PREFIX = 'cache:lock:'
+LOCK_TIMEOUT = 10  # Seconds a Redis recompute lock is held at most
+LOCK_WAIT = 5  # Seconds to wait for another worker's recomputation
+LOCK_POLL_INTERVAL = 0.05
 
-def cache_response(prefix, expire=300):
+# Deletes the lock only if it is still held by the caller's token
+RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# Namespaces invalidated while Redis was unreachable, bumped in Redis once it
+# is back so that no worker reads entries stored before the invalidation
+_pending_invalidations = set()
+_pending_invalidations_lock = threading.Lock()
+
+# In-flight recomputations in this process, by memory key
+_flights = {}
+_flights_lock = threading.Lock()
+
+# Hit/miss/store/eviction/invalidation counters and latencies, per prefix and tier
+cache_metrics = CacheMetrics()
+
+class LRUCache:
+    """
+    Thread-safe in-process LRU cache bounded by entry count and approximate size.
+    
+    Sizes are estimated from the JSON encoding of each value. When a bound is
+    exceeded, expired entries are dropped first and then the least recently
+    used ones. Evictions and expirations are counted for get_cache_stats, and
+    reported with the key to on_remove(key, reason) if given.
+    """
+    
+    def __init__(self, max_entries, max_bytes, on_remove=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.on_remove = on_remove
+        self._entries = OrderedDict()  # key -> (value, expires_at, size)
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def get(self, key):
+        """Return the cached value, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.time():
+                self._remove(key)
+                self.expirations += 1
+                self._notify(key, 'expiration')
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+    
+    def set(self, key, value, expire, size=None):
+        """Store a value for expire seconds, evicting entries to stay within bounds"""
+        if size is None:
+            size = len(json.dumps(value, cls=DateTimeEncoder))
+        if size > self.max_bytes:
+            logger.debug(f"Not caching {key} in memory: {size} bytes exceeds the size bound")
+            return
+        
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, time.time() + expire, size)
+            self.total_bytes += size
+            
+            if len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes:
+                self._evict()
+    
+    def pop(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+    
+    def keys(self):
+        with self._lock:
+            return list(self._entries.keys())
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def __contains__(self, key):
+        return key in self._entries
+    
+    def stats(self):
+        return {
+            'size': len(self._entries),
+            'bytes': self.total_bytes,
+            'max_entries': self.max_entries,
+            'max_bytes': self.max_bytes,
+            'evictions': self.evictions,
+            'expirations': self.expirations
+        }
+    
+    def _remove(self, key):
+        _, _, size = self._entries.pop(key)
+        self.total_bytes -= size
+    
+    def _evict(self):
+        # Expired entries go first, regardless of recency
+        now = time.time()
+        for key in [k for k, (_, expires_at, _) in self._entries.items() if expires_at <= now]:
+            self._remove(key)
+            self.expirations += 1
+            self._notify(key, 'expiration')
+        
+        # Then the least recently used entries until both bounds hold
+        while self._entries and (len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes):
+            key, (_, _, size) = self._entries.popitem(last=False)
+            self.total_bytes -= size
+            self.evictions += 1
+            self._notify(key, 'eviction')
+            logger.debug(f"Evicted {key} from memory cache")
+    
+    def _notify(self, key, reason):
+        if self.on_remove:
+            self.on_remove(key, reason)
+
+# In-process cache tier, used alone when Redis is not available
+memory_cache = LRUCache(
+    MEMORY_CACHE_MAX_ENTRIES,
+    MEMORY_CACHE_MAX_BYTES,
+    on_remove=lambda key, reason: cache_metrics.incr(cache_metrics.prefix_for(key), 'memory', reason)
+)
+
+def _cache_vary_value(vary_on):
+    """
+    Resolve the identity dimension of a cache key for the current request.
+    
+    Args:
+        vary_on (str): None, 'identity' (JWT user id) or 'role' (JWT role claim)
+    
+    Returns:
+        str: Value to mix into the cache key, or None when not varying
+    """
+    if not vary_on:
+        return None
+    
+    try:
+        identity = get_jwt_identity()
+    except RuntimeError:
+        # No JWT was verified for this request
+        identity = None
+    if identity is None:
+        return 'anonymous'
+    
+    if vary_on == 'role':
+        # Tokens issued without a role claim fall back to per-user entries
+        role = get_jwt().get('role')
+        if role:
+            return f"role:{role}"
+    
+    return f"user:{identity}"
+
+def build_cache_key(prefix, func, args, kwargs, vary_on=None):
+    """
+    Build a bounded-length cache key for a request.
+    
+    The readable part is the prefix followed by the view arguments, so prefix
+    invalidation such as "services:detail:5" keeps working. The class and
+    function name, the normalized query string and the optional identity
+    dimension are hashed into a fixed-length suffix.
+    
+    Args:
+        prefix (str): Prefix for the cache key
+        func: The decorated view function
+        args (tuple): Positional arguments of the call
+        kwargs (dict): Keyword (view) arguments of the call
+        vary_on (str): Optional identity dimension, see _cache_vary_value
+    
+    Returns:
+        str: The cache key
+    """
+    key_parts = [prefix]
+    
+    # Add view arguments to the readable part of the key
+    for arg in args[1:]:
+        if isinstance(arg, (str, int, float, bool)):
+            key_parts.append(str(arg))
+    for k, v in sorted(kwargs.items()):
+        if isinstance(v, (str, int, float, bool)):
+            key_parts.append(str(v))
+    
+    # Normalize query parameters: sorted names and values, empty values dropped
+    query_params = []
+    if has_request_context():
+        for name in sorted(request.args.keys()):
+            values = sorted(v.strip() for v in request.args.getlist(name) if v.strip())
+            if values:
+                query_params.append([name, values])
+    
+    owner = args[0].__class__.__name__ if args and hasattr(args[0], '__class__') else ''
+    fingerprint = json.dumps([owner, func.__name__, query_params, _cache_vary_value(vary_on)])
+    key_parts.append(hashlib.sha256(fingerprint.encode()).hexdigest()[:32])
+    
+    return ":".join(key_parts)
+
+def _key_namespaces(cache_key):
+    """Namespaces a cache key belongs to: every ':'-prefix of its readable head"""
+    parts = cache_key.split(':')[:-1]  # Drop the hashed suffix
+    return [':'.join(parts[:i + 1]) for i in range(len(parts))]
+
+def _redis_generations(namespaces):
+    """Fetch the shared generations of the namespaces in one round trip"""
+    values = redis_client.mget([GENERATION_KEY_PREFIX + ns for ns in namespaces])
+    return [value or '0' for value in values]
+
+def _memory_tier_coherent():
+    """True if this process receives every other worker's invalidations"""
+    return invalidation_broker is not None and invalidation_broker.connected
+
+class EntryKeys:
+    """
+    Storage keys of a cache entry for the current namespace generations.
+    
+    The Redis key only depends on the shared generations in Redis and is
+    resolved (one MGET) on first use. The memory key depends on this process'
+    local generations, which the invalidation broker keeps in sync across
+    workers, so memory hits need no Redis round trip. Without a connected
+    broker the memory key also includes the Redis generations, so remote
+    invalidations still take effect.
+    """
+    
+    def __init__(self, cache_key):
+        self.cache_key = cache_key
+        self.namespaces = _key_namespaces(cache_key)
+        self._redis = None
+        self._redis_resolved = False
+        
+        local_tag = '.'.join(local_generations.get(ns, '0') for ns in self.namespaces)
+        if _memory_tier_coherent() or not redis_available():
+            self.memory = f"{cache_key}#{local_tag}"
+        else:
+            self.memory = f"{self.redis or cache_key}#{local_tag}"
+    
+    @property
+    def redis(self):
+        """Redis key, or None if Redis is unavailable"""
+        if not self._redis_resolved:
+            self._redis_resolved = True
+            if redis_available():
+                try:
+                    self._redis = f"{self.cache_key}#{'.'.join(_redis_generations(self.namespaces))}"
+                except Exception as e:
+                    logger.warning(f"Error reading cache generations from Redis: {e}")
+        return self._redis
+
+def _ensure_subscribed():
+    """Subscribe this process to broadcast invalidations (again after a fork)"""
+    global _subscribed_pid
+    if invalidation_broker is None or _subscribed_pid == os.getpid():
+        return
+    with _subscribe_lock:
+        if _subscribed_pid != os.getpid():
+            _subscribed_pid = os.getpid()
+            invalidation_broker.subscribe(
+                INVALIDATION_CHANNEL, _apply_broadcast_invalidation, on_connect=_on_broker_connect
+            )
+
+def _on_broker_connect():
+    # Invalidations published while this worker was not listening are lost, so
+    # entries stored in the meantime cannot be trusted
+    memory_cache.clear()
+
+def _apply_broadcast_invalidation(message):
+    """Apply another worker's invalidation to this process' memory tier"""
+    data = json.loads(message)
+    if data['origin'] == WORKER_ID:
+        return
+    namespace = data['namespace']
+    # Memory keys embed the local generations, so bumping it is enough: old
+    # entries can no longer be hit and are dropped by the LRU bounds or TTL
+    local_generations[namespace] = data['generation']
+    _mark_invalidation()
+    logger.debug(f"Applied invalidation of '{namespace}' from {data['origin']}")
+
+def set_invalidation_broker(broker):
+    """
+    Replace the invalidation broker, e.g. with an InProcessBroker in tests.
+    
+    Args:
+        broker: InProcessBroker, RedisBroker or None to stop broadcasting
+    """
+    global invalidation_broker, _subscribed_pid
+    if invalidation_broker is not None:
+        invalidation_broker.close()
+    invalidation_broker = broker
+    _subscribed_pid = None
+    _ensure_subscribed()
+
+# Redis entry header: fresh_until as a big-endian double and the content digest
+ENTRY_HEADER = struct.Struct('!d16s')
+
+class CacheEntry:
+    """A cached JSON response body with its freshness deadline and content hash"""
+    __slots__ = ('body', 'digest', 'fresh_until')
+    
+    def __init__(self, body, digest, fresh_until):
+        self.body = body
+        self.digest = digest
+        self.fresh_until = fresh_until
+    
+    @classmethod
+    def from_body(cls, body, fresh_until):
+        return cls(body, hashlib.sha256(body).digest()[:16], fresh_until)
+    
+    @classmethod
+    def from_redis(cls, data):
+        fresh_until, digest = ENTRY_HEADER.unpack_from(data)
+        return cls(payload_codec.loads(data[ENTRY_HEADER.size:]), digest, fresh_until)
+    
+    def to_redis(self):
+        return ENTRY_HEADER.pack(self.fresh_until, self.digest) + payload_codec.dumps(self.body)
+    
+    @property
+    def etag(self):
+        return self.digest.hex()
+    
+    def is_fresh(self):
+        return self.fresh_until > time.time()
+
+def _record_read(prefix, tier, entry, started):
+    """Count a tier lookup as hit, stale_hit or miss and record its latency"""
+    event = 'miss' if entry is None else 'hit' if entry.is_fresh() else 'stale_hit'
+    cache_metrics.incr(prefix, tier, event)
+    cache_metrics.observe(prefix, tier, 'read', time.perf_counter() - started)
+
+def _read_entry(prefix, keys, record=True):
+    """
+    Look up a cache entry in the memory tier, then in Redis.
+    
+    Args:
+        prefix (str): Prefix of the entry, for the metrics
+        keys (EntryKeys): Storage keys of the entry; the Redis key is only
+            resolved when the memory tier has no fresh entry
+        record (bool): Count the lookups in the tier metrics; False for the
+            polls of a request that already recorded its read
+    
+    Returns:
+        tuple: (CacheEntry or None, fresh) where fresh is False for entries past
+        their expire time that are still kept for stale-while-revalidate
+    """
+    started = time.perf_counter()
+    stale_entry = memory_cache.get(keys.memory)
+    if record:
+        _record_read(prefix, 'memory', stale_entry, started)
+    if stale_entry is not None and stale_entry.is_fresh():
+        return stale_entry, True
+    
+    if keys.redis:
+        started = time.perf_counter()
+        try:
+            cached_data = redis_bytes_client.get(keys.redis)
+            entry = CacheEntry.from_redis(cached_data) if cached_data else None
+            if record:
+                _record_read(prefix, 'redis', entry, started)
+            if entry is not None:
+                if entry.is_fresh():
+                    return entry, True
+                stale_entry = stale_entry or entry
+        except Exception as e:
+            # If any Redis error, silently fallback to memory cache
+            cache_metrics.incr(prefix, 'redis', 'error')
+            logger.debug(f"Redis cache read failed: {e}")
+    
+    return stale_entry, False
+
+def _store_entry(prefix, redis_key, memory_key, result, expire):
+    """
+    Store a successful result in both tiers, kept STALE_GRACE seconds past expiry.
+    
+    The body is encoded to JSON and hashed once; the memory tier keeps those
+    bytes as-is and Redis stores them through the configured payload codec.
+    
+    Returns:
+        CacheEntry: The stored entry
+    """
+    entry = CacheEntry.from_body(encode_json(result[0]), time.time() + expire)
+    
+    # Try to cache in Redis first
+    if redis_key:
+        started = time.perf_counter()
+        try:
+            redis_bytes_client.setex(name=redis_key, time=expire + STALE_GRACE, value=entry.to_redis())
+            cache_metrics.incr(prefix, 'redis', 'store')
+            cache_metrics.observe(prefix, 'redis', 'write', time.perf_counter() - started)
+        except Exception as e:
+            # Silently fallback to memory cache on error
+            cache_metrics.incr(prefix, 'redis', 'error')
+            logger.debug(f"Redis cache write failed: {e}")
+    
+    # Cache in memory regardless; the LRU tier enforces its own bounds
+    memory_cache.set(memory_key, entry, expire + STALE_GRACE, size=len(entry.body))
+    cache_metrics.incr(prefix, 'memory', 'store')
+    return entry
+
+def _cached_response(prefix, entry):
+    """
+    Serve a cache entry with its ETag.
+    
+    Answers 304 Not Modified with no body when the client's If-None-Match
+    already names the entry; otherwise the cached JSON bytes are
+    the response body directly, skipping Flask-RESTful's re-serialization.
+    """
+    if has_request_context() and request.if_none_match.contains_weak(entry.etag):
+        cache_metrics.incr(prefix, 'response', 'not_modified')
+        response = Response(status=304)
+    else:
+        response = Response(entry.body, status=200, mimetype='application/json')
+    response.set_etag(entry.etag)
+    return response
+
+def _acquire_flight(memory_key, redis_key, wait):
+    """
+    Try to become the single worker recomputing a cache entry.
+    
+    Within this process one thread leads per key; across workers the leader
+    must also hold a short-lived Redis lock.
+    
+    Args:
+        wait (bool): Whether to wait for another thread's flight instead of
+            returning immediately
+    
+    Returns:
+        tuple: (is_leader, redis lock token or None)
+    """
+    with _flights_lock:
+        flight = _flights.get(memory_key)
+        if flight is None:
+            _flights[memory_key] = threading.Event()
+    
+    if flight is not None:
+        if wait:
+            flight.wait(LOCK_WAIT)
+        return False, None
+    
+    token = None
+    if redis_key:
+        try:
+            token = uuid.uuid4().hex
+            if not redis_client.set(LOCK_KEY_PREFIX + redis_key, token, nx=True, ex=LOCK_TIMEOUT):
+                _release_flight(memory_key, redis_key, None)
+                return False, None
+        except Exception as e:
+            # Without Redis, leading within this process is the best we can do
+            logger.debug(f"Redis cache lock failed: {e}")
+            token = None
+    
+    return True, token
+
+def _flight_in_progress(memory_key, redis_key):
+    """True while a thread of this process or another worker recomputes the entry"""
+    with _flights_lock:
+        if memory_key in _flights:
+            return True
+    if redis_key:
+        try:
+            return bool(redis_client.exists(LOCK_KEY_PREFIX + redis_key))
+        except Exception as e:
+            logger.debug(f"Redis cache lock check failed: {e}")
+    return False
+
+def _release_flight(memory_key, redis_key, token):
+    """Release the local flight and, if held, the Redis lock"""
+    if token:
+        try:
+            redis_client.eval(RELEASE_LOCK_SCRIPT, 1, LOCK_KEY_PREFIX + redis_key, token)
+        except Exception as e:
+            logger.debug(f"Redis cache unlock failed: {e}")
+    
+    with _flights_lock:
+        flight = _flights.pop(memory_key, None)
+    if flight:
+        flight.set()
+
+def cache_response(prefix, expire=300, vary_on=None):
     """
     Decorator to cache API responses in memory.
     
+    Keys include the view arguments and the normalized query string. Role-scoped
+    endpoints must opt into an identity dimension with vary_on so that one
+    user's response is never served to another.
+    
+    Expensive recomputation is single-flight: on a miss only one thread per
+    process and one worker across processes (via a Redis lock) calls the
+    function, while the others wait for its result. Entries are kept for
+    STALE_GRACE seconds after they expire, and during that window one caller
+    refreshes the entry while everyone else is served the stale value.
+    
+    Hits return the stored JSON bytes as the response body directly, with an
+    ETag of their content hash; a matching If-None-Match gets 304 Not Modified.
+    
     Args:
         prefix (str): Prefix for the cache key
         expire (int): Cache expiration time in seconds (default: 5 minutes)
+        vary_on (str): None, 'identity' to cache per user or 'role' to cache
+            per JWT role claim
     
     Returns:
         Decorated function
     """
     def decorator(func):
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
+        cache_metrics.register_prefix(prefix)
+        
+        def compute(redis_key, memory_key, args, kwargs):
+            result = func(*args, **kwargs)
+            # Only cache successful responses that reflect every write seen so far
+            if isinstance(result, tuple) and len(result) == 2 and result[1] == 200 and not _may_predate_writes():
+                # Serve the same bytes that later hits will return
+                return _cached_response(prefix, _store_entry(prefix, redis_key, memory_key, result, expire))
+            return result
+        
+        def respond(args, kwargs):
+            """Serve the request, returning (response, outcome) for the metrics"""
             try:
-                # Generate a cache key from the function arguments
-                key_parts = [prefix]
-                # Add class name if it's a method in a class
-                if args and hasattr(args[0], '__class__'):
-                    key_parts.append(args[0].__class__.__name__)
-                
-                # Add function arguments to the key
-                for arg in args[1:]:
-                    if isinstance(arg, (str, int, float, bool)):
-                        key_parts.append(str(arg))
-                
-                # Add keyword arguments to the key
-                for k, v in sorted(kwargs.items()):
-                    if isinstance(v, (str, int, float, bool)):
-                        key_parts.append(f"{k}:{v}")
-                
-                cache_key = ":".join(key_parts)
-                
-                # If Redis is available, try Redis first
-                if REDIS_AVAILABLE:
-                    try:
-                        cached_data = redis_client.get(cache_key)
-                        if cached_data:
-                            logger.debug(f"Redis cache hit for {cache_key}")
-                            return json.loads(cached_data)
-                    except:
-                        # If any Redis error, silently fallback to memory cache
-                        pass
-                
-                # Try memory cache
-                current_time = time.time()
-                if cache_key in memory_cache and memory_cache_expiry.get(cache_key, 0) > current_time:
-                    logger.debug(f"Memory cache hit for {cache_key}")
-                    return memory_cache[cache_key]
-                
-                # Cache miss - call the function
-                result = func(*args, **kwargs)
-                
-                # Only cache successful responses
-                if isinstance(result, tuple) and len(result) == 2 and result[1] == 200:
-                    # Try to cache in Redis first
-                    if REDIS_AVAILABLE:
-                        try:
-                            redis_client.setex(
-                                name=cache_key,
-                                time=expire,
-                                value=json.dumps(result[0], cls=DateTimeEncoder)
-                            )
-                        except:
-                            # Silently fallback to memory cache on error
-                            pass
-                    
-                    # Cache in memory regardless
-                    memory_cache[cache_key] = result
-                    memory_cache_expiry[cache_key] = current_time + expire
-                    
-                    # Simple memory cleanup
-                    if len(memory_cache) > 1000:
-                        for k in list(memory_cache_expiry.keys()):
-                            if memory_cache_expiry[k] <= current_time:
-                                memory_cache.pop(k, None)
-                                memory_cache_expiry.pop(k, None)
-                
-                return result
+                # Generate a cache key from the request, versioned by namespace generations
+                cache_key = build_cache_key(prefix, func, args, kwargs, vary_on)
+                _ensure_subscribed()
+                keys = EntryKeys(cache_key)
+                entry, fresh = _read_entry(prefix, keys)
             except Exception as e:
-                # On any error, just call the original function
+                # On any cache error, just call the original function
                 logger.error(f"Cache error, bypassing cache: {e}")
-                return func(*args, **kwargs)
+                return func(*args, **kwargs), 'bypass'
+            
+            if entry is not None and fresh:
+                logger.debug(f"Cache hit for {cache_key}")
+                return _cached_response(prefix, entry), 'hit'
+            
+            redis_key, memory_key = keys.redis, keys.memory
+            
+            if entry is not None:
+                # Stale: one caller refreshes, everyone else gets the stale value
+                is_leader, token = _acquire_flight(memory_key, redis_key, wait=False)
+                if not is_leader:
+                    logger.debug(f"Serving stale cache entry for {cache_key}")
+                    return _cached_response(prefix, entry), 'stale'
+                try:
+                    return compute(redis_key, memory_key, args, kwargs), 'miss'
+                finally:
+                    _release_flight(memory_key, redis_key, token)
+            
+            # Miss: become the leader, or wait for the in-flight computation of the same key
+            deadline = time.time() + LOCK_WAIT
+            is_leader, token = _acquire_flight(memory_key, redis_key, wait=True)
+            if not is_leader:
+                while True:
+                    entry, _ = _read_entry(prefix, keys, record=False)
+                    if entry is not None:
+                        logger.debug(f"Cache filled by concurrent request for {cache_key}")
+                        return _cached_response(prefix, entry), 'hit'
+                    if not _flight_in_progress(memory_key, redis_key) or time.time() >= deadline:
+                        # The leader stored nothing (e.g. an error response) or is too slow;
+                        # call the view directly rather than queueing behind another flight
+                        return compute(redis_key, memory_key, args, kwargs), 'miss'
+                    time.sleep(LOCK_POLL_INTERVAL)
+            
+            try:
+                return compute(redis_key, memory_key, args, kwargs), 'miss'
+            finally:
+                _release_flight(memory_key, redis_key, token)
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            response, outcome = respond(args, kwargs)
+            cache_metrics.incr(prefix, 'response', outcome)
+            cache_metrics.observe(prefix, 'response', outcome, time.perf_counter() - started)
+            return response
         
+        wrapper.cache_prefix = prefix
         return wrapper
     
     return decorator
 
 def invalidate_cache_prefix(prefix):
     """
-    Invalidate all cache entries with the given prefix
+    Invalidate all cache entries under the given prefix in constant time
+    
+    The prefix names a namespace (a trailing ':' is ignored), e.g. "services"
+    also covers "services:list" and "services:detail:5". Its generation is
+    bumped locally and in Redis; entries stored under the old generation are
+    no longer reachable and are cleaned up by their TTL. The new generation is
+    broadcast to the other workers, which adopt it for their memory tier.
     
     Args:
         prefix (str): Prefix of the cache keys to invalidate
     """
-    # Clear memory cache entries
-    keys_to_remove = []
-    for key in memory_cache.keys():
-        if key.startswith(prefix):
-            keys_to_remove.append(key)
+    _ensure_subscribed()
+    namespace = prefix.rstrip(':')
+    # A fresh unique token; unlike a counter it can never repeat an old generation
+    generation = format(time.time_ns(), 'x')
     
-    for key in keys_to_remove:
-        memory_cache.pop(key, None)
-        memory_cache_expiry.pop(key, None)
+    local_generations[namespace] = generation
+    _mark_invalidation()
+    logger.debug(f"Invalidated memory cache namespace '{namespace}'")
+    affected = cache_metrics.prefixes_under(namespace)
+    for metrics_prefix in affected:
+        cache_metrics.incr(metrics_prefix, 'memory', 'invalidation')
     
-    logger.debug(f"Invalidated {len(keys_to_remove)} memory cache entries with prefix '{prefix}'")
+    # Bump the shared generation before broadcasting, so workers evicting their
+    # memory tier never refill it from the old Redis entry
+    if REDIS_ENABLED:
+        try:
+            redis_client.set(GENERATION_KEY_PREFIX + namespace, generation, ex=GENERATION_TTL)
+            for metrics_prefix in affected:
+                cache_metrics.incr(metrics_prefix, 'redis', 'invalidation')
+            logger.debug(f"Invalidated Redis cache namespace '{namespace}'")
+        except Exception as e:
+            logger.warning(f"Error invalidating Redis cache, retrying once it is reachable: {e}")
+            with _pending_invalidations_lock:
+                _pending_invalidations.add(namespace)
     
-    # Clear Redis cache entries if available
-    if REDIS_AVAILABLE:
+    if invalidation_broker is not None:
         try:
-            redis_keys = redis_client.keys(f"{prefix}*")
-            if redis_keys:
-                redis_client.delete(*redis_keys)
-                logger.debug(f"Invalidated {len(redis_keys)} Redis cache entries with prefix '{prefix}'")
+            invalidation_broker.publish(INVALIDATION_CHANNEL, json.dumps({
+                'origin': WORKER_ID,
+                'namespace': namespace,
+                'generation': generation
+            }))
         except Exception as e:
-            logger.warning(f"Error invalidating Redis cache: {e}")
+            logger.warning(f"Error broadcasting cache invalidation, retrying once Redis is reachable: {e}")
+            with _pending_invalidations_lock:
+                _pending_invalidations.add(namespace)
+
+def _mark_invalidation():
+    global _last_invalidation
+    _last_invalidation = time.time()
+
+def _may_predate_writes():
+    """
+    True if the current request read from a lagging replica within
+    READ_PRIMARY_WINDOW seconds of a write. Its response may not include that
+    write, and caching it under the freshly bumped generation would serve it
+    to every client, including the writer, until it expires.
+    """
+    return read_from_replica() and seconds_since_invalidation() < current_app.config.get('READ_PRIMARY_WINDOW', 0)
+
+def seconds_since_invalidation():
+    """
+    Seconds since this process last invalidated a namespace or received an
+    invalidation from another worker, i.e. since the database last changed
+    """
+    return time.time() - _last_invalidation
+
+def _sync_pending_invalidations():
+    """Bump the Redis generations of namespaces invalidated during an outage"""
+    with _pending_invalidations_lock:
+        namespaces = sorted(_pending_invalidations)
+        _pending_invalidations.clear()
+    
+    for namespace in namespaces:
+        invalidate_cache_prefix(namespace)
+    if namespaces:
+        logger.info(f"Replayed {len(namespaces)} cache invalidations to Redis")
 
-def get_cache_stats():
+def get_cache_stats(include_metrics=True):
     """
     Get cache statistics
     
+    Args:
+        include_metrics (bool): Include the per-prefix counters and latency
+            histograms, not just the totals
+    
     Returns:
         dict: Dictionary with cache statistics
     """
     stats = {
-        'memory_cache': {
-            'size': len(memory_cache),
-            'keys': list(memory_cache.keys())[:10]  # First 10 keys only
-        }
+        'memory_cache': dict(
+            memory_cache.stats(),
+            keys=memory_cache.keys()[:10]  # First 10 keys only
+        )
     }
     
-    if REDIS_AVAILABLE:
+    if redis_available():
         try:
             redis_info = redis_client.info()
             stats['redis'] = {
@@ -206,4 +858,24 @@ def get_cache_stats():
             'connected': False
         }
     
+    stats['invalidation_broker'] = {
+        'type': CACHE_INVALIDATION_BROKER,
+        'connected': _memory_tier_coherent(),
+        'worker_id': WORKER_ID
+    }
+    
+    if REDIS_ENABLED:
+        stats['redis']['circuit_breaker'] = redis_breaker.stats()
+        stats['redis']['pool'] = {
+            'max_connections': REDIS_MAX_CONNECTIONS,
+            'socket_timeout': REDIS_SOCKET_TIMEOUT
+        }
+    
+    stats['active_cache'] = 'redis' if stats['redis']['connected'] else 'memory'
+    
+    metrics = cache_metrics.snapshot()
+    if not include_metrics:
+        del metrics['prefixes']
+    stats['metrics'] = metrics
+    
     return stats 
\ No newline at end of file
@@ -0,0 +1,118 @@
+import logging
+import os
+import threading
+import time
+from collections import namedtuple
+from types import MappingProxyType
+from backend.model import db, Service
+from backend.cache import local_generations
+
+logger = logging.getLogger(__name__)
+
+# Cache namespace whose generation versions the catalog; commits touching
+# Service rows bump it (see backend.invalidation) and the invalidation broker
+# propagates it to the other workers
+CATALOG_NAMESPACE = 'service_catalog'
+
+# Upper bound on a snapshot's age, for workers that do not receive broadcast
+# invalidations
+CATALOG_MAX_AGE = int(os.environ.get('SERVICE_CATALOG_MAX_AGE', 60))
+
+# Minimum age before a snapshot missing a referenced service is rebuilt, so
+# dangling service ids cannot trigger a rebuild on every read
+CATALOG_MIN_REFRESH_INTERVAL = float(os.environ.get('SERVICE_CATALOG_MIN_REFRESH_INTERVAL', 1))
+
+# Read-only copy of a Service row, with the same attribute names
+ServiceRecord = namedtuple('ServiceRecord', ['id', 'name', 'price', 'time_req', 'description', 'service_type'])
+
+class CatalogSnapshot:
+    """Immutable view of every service at one catalog version, indexed by id and service_type"""
+
+    def __init__(self, version, token, services):
+        self.version = version
+        self.token = token
+        self.built_at = time.time()
+        self.services = tuple(sorted(services, key=lambda service: service.id))
+        self.by_id = MappingProxyType({service.id: service for service in self.services})
+
+        by_type = {}
+        for service in self.services:
+            by_type.setdefault(service.service_type, []).append(service)
+        # Types keep the order of their first service, like SELECT DISTINCT over the table
+        self.by_type = MappingProxyType({t: tuple(services) for t, services in by_type.items()})
+
+    def get(self, service_id):
+        """The service with this id, or None"""
+        return self.by_id.get(service_id)
+
+    def of_type(self, service_type):
+        """Services of a type, ordered by id"""
+        return self.by_type.get(service_type, ())
+
+    @property
+    def service_types(self):
+        return list(self.by_type)
+
+class ServiceCatalog:
+    """
+    In-process snapshot of the Service table.
+
+    Readers get the current CatalogSnapshot; a new one is built from committed
+    rows and swapped in atomically on the first read after the catalog's
+    namespace generation changes (i.e. after a commit that touched a Service)
+    or after CATALOG_MAX_AGE seconds.
+    """
+
+    def __init__(self, max_age=CATALOG_MAX_AGE):
+        self.max_age = max_age
+        self._snapshot = None
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def snapshot(self):
+        """Return the current snapshot, rebuilding it if it is outdated"""
+        snapshot = self._snapshot
+        token = local_generations.get(CATALOG_NAMESPACE, '0')
+        if snapshot is None or snapshot.token != token or time.time() - snapshot.built_at > self.max_age:
+            snapshot = self._rebuild(token)
+        return snapshot
+
+    def get(self, service_id):
+        """The service with this id from the current snapshot, or None"""
+        snapshot = self.snapshot()
+        service = snapshot.get(service_id)
+        if service is None:
+            service = self.refresh(snapshot).get(service_id)
+        return service
+
+    def refresh(self, stale):
+        """
+        Rebuild the catalog after `stale` turned out to miss a service, e.g. one
+        committed by another worker whose invalidation has not arrived yet.
+        Snapshots younger than CATALOG_MIN_REFRESH_INTERVAL are kept.
+        """
+        if time.time() - stale.built_at < CATALOG_MIN_REFRESH_INTERVAL:
+            return self.snapshot()
+        return self._rebuild(local_generations.get(CATALOG_NAMESPACE, '0'), stale)
+
+    def _rebuild(self, token, stale=None):
+        with self._lock:
+            snapshot = self._snapshot
+            if (snapshot is not None and snapshot is not stale and snapshot.token == token
+                    and time.time() - snapshot.built_at <= self.max_age):
+                return snapshot  # Another thread rebuilt it meanwhile
+
+            # A separate connection only sees committed rows, never the caller's pending changes
+            with db.engine.connect() as conn:
+                rows = conn.execute(db.select(
+                    Service.id, Service.name, Service.price, Service.time_req,
+                    Service.description, Service.service_type
+                )).all()
+
+            self._version += 1
+            snapshot = CatalogSnapshot(self._version, token, [ServiceRecord(*row) for row in rows])
+            self._snapshot = snapshot
+            logger.debug(f"Service catalog rebuilt: version {snapshot.version}, {len(rows)} services")
+            return snapshot
+
+service_catalog = ServiceCatalog()
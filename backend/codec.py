@@ -0,0 +1,150 @@
+import json
+import os
+import zlib
+import logging
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# Optional codec dependencies; the JSON and zlib codecs are always available
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import lz4.frame
+except ImportError:
+    lz4 = None
+
+# Serializer and compression used for new Redis payloads (existing payloads
+# carry their own header, so changing these never breaks reads)
+CACHE_CODEC = os.environ.get('CACHE_CODEC', 'json')
+CACHE_COMPRESSION = os.environ.get('CACHE_COMPRESSION', 'zlib')
+# Payloads smaller than this are stored uncompressed
+CACHE_COMPRESS_THRESHOLD = int(os.environ.get('CACHE_COMPRESS_THRESHOLD', 1024))
+
+class DateTimeEncoder(json.JSONEncoder):
+    """JSON encoder that serializes datetime objects as ISO 8601 strings"""
+    def default(self, obj):
+        if isinstance(obj, datetime):
+            return obj.isoformat()
+        return super().default(obj)
+
+def encode_json(body):
+    """Encode a response body as compact UTF-8 JSON"""
+    return json.dumps(body, cls=DateTimeEncoder, separators=(',', ':')).encode('utf-8')
+
+class JSONCodec:
+    """
+    Stores the JSON body itself, so hits can be served without a decode/encode
+    round trip.
+    """
+    id = 0
+    name = 'json'
+
+    def dumps(self, json_body):
+        return json_body
+
+    def to_json(self, data):
+        return data
+
+class MsgpackCodec:
+    """Stores the body as MessagePack, which is smaller than JSON for most payloads"""
+    id = 1
+    name = 'msgpack'
+
+    def dumps(self, json_body):
+        return msgpack.packb(json.loads(json_body), use_bin_type=True)
+
+    def to_json(self, data):
+        return encode_json(msgpack.unpackb(data, raw=False))
+
+class NoCompression:
+    id = 0
+    name = 'none'
+
+    def compress(self, data):
+        return data
+
+    def decompress(self, data):
+        return data
+
+class ZlibCompression:
+    id = 1
+    name = 'zlib'
+
+    def compress(self, data):
+        return zlib.compress(data, 6)
+
+    def decompress(self, data):
+        return zlib.decompress(data)
+
+class LZ4Compression:
+    id = 2
+    name = 'lz4'
+
+    def compress(self, data):
+        return lz4.frame.compress(data)
+
+    def decompress(self, data):
+        return lz4.frame.decompress(data)
+
+CODECS = {codec.id: codec for codec in (JSONCodec(), MsgpackCodec())}
+COMPRESSIONS = {compression.id: compression for compression in (NoCompression(), ZlibCompression(), LZ4Compression())}
+
+def _by_name(registry, name, available):
+    for item in registry.values():
+        if item.name == name:
+            if available(item):
+                return item
+            logger.warning(f"Cache codec '{name}' is not installed, falling back to '{registry[0].name}'")
+            return registry[0]
+    logger.warning(f"Unknown cache codec '{name}', falling back to '{registry[0].name}'")
+    return registry[0]
+
+class PayloadCodec:
+    """
+    Encodes cached response bodies for Redis.
+
+    Each payload starts with a header byte recording the serializer (high
+    nibble) and compression (low nibble) it was written with, followed by the
+    possibly compressed data.
+    """
+
+    def __init__(self, codec='json', compression='zlib', threshold=1024):
+        self.codec = _by_name(CODECS, codec, lambda c: c.id != MsgpackCodec.id or msgpack is not None)
+        self.compression = _by_name(COMPRESSIONS, compression, lambda c: c.id != LZ4Compression.id or lz4 is not None)
+        self.threshold = threshold
+
+    def dumps(self, json_body):
+        """
+        Encode a JSON response body for storage.
+
+        Args:
+            json_body (bytes): The body as produced by encode_json
+
+        Returns:
+            bytes: Header byte followed by the encoded payload
+        """
+        data = self.codec.dumps(json_body)
+        compression = self.compression if len(data) >= self.threshold else COMPRESSIONS[NoCompression.id]
+        return bytes([self.codec.id << 4 | compression.id]) + compression.compress(data)
+
+    def loads(self, payload):
+        """
+        Decode a stored payload back to the JSON response body.
+
+        For uncompressed JSON payloads this is a slice of the stored bytes.
+
+        Raises:
+            ValueError: If the payload was written with an unknown codec
+        """
+        header = payload[0]
+        codec = CODECS.get(header >> 4)
+        compression = COMPRESSIONS.get(header & 0x0F)
+        if codec is None or compression is None:
+            raise ValueError(f"Unknown cache payload header {header:#x}")
+        return codec.to_json(compression.decompress(payload[1:]))
+
+payload_codec = PayloadCodec(CACHE_CODEC, CACHE_COMPRESSION, CACHE_COMPRESS_THRESHOLD)
@@ -0,0 +1,94 @@
+import logging
+import weakref
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+# Pragmas of each profiled engine, read by its connect listener
+_engine_pragmas = weakref.WeakKeyDictionary()
+
+def sqlite_pragmas(app):
+    """
+    Pragmas of the SQLite profile selected by SQLITE_PROFILE.
+
+    Args:
+        app: Flask application whose config holds SQLITE_PROFILE and SQLITE_PROFILES
+
+    Returns:
+        dict: Pragma names and values, in the order they are applied
+    """
+    profile = app.config.get('SQLITE_PROFILE', 'default')
+    profiles = app.config.get('SQLITE_PROFILES', {})
+    if profile not in profiles:
+        raise ValueError(f"Unknown SQLite profile '{profile}', expected one of {sorted(profiles)}")
+    return profiles[profile]
+
+def apply_pragmas(dbapi_connection, pragmas):
+    """Run PRAGMA statements on a raw DB-API connection"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas.items():
+            if not name.isidentifier():
+                raise ValueError(f"Invalid pragma name '{name}'")
+            cursor.execute(f"PRAGMA {name} = {value}")
+    finally:
+        cursor.close()
+
+def read_only_pragmas(pragmas):
+    """
+    Pragmas for a read-only connection: journal_mode is left to the primary
+    (a read-only connection cannot change it; WAL persists in the file) and
+    query_only guards against writes.
+    """
+    pragmas = {name: value for name, value in pragmas.items() if name != 'journal_mode'}
+    pragmas['query_only'] = 'ON'
+    return pragmas
+
+def is_read_only(engine):
+    """True for SQLite engines opened with mode=ro"""
+    return engine.url.query.get('mode') == 'ro'
+
+def _listen_for_connections(engine):
+    def on_connect(dbapi_connection, connection_record):
+        pragmas = _engine_pragmas.get(engine)
+        if pragmas:
+            apply_pragmas(dbapi_connection, pragmas)
+
+    event.listen(engine, 'connect', on_connect)
+
+def init_sqlite_profile(app, db):
+    """
+    Apply the configured SQLite profile to every connection of the app's engines.
+
+    The pragmas are run by a 'connect' listener on each SQLite engine, so
+    pooled connections opened later get them too; connections already in the
+    pool are discarded. Read-only engines (see backend.routing) get the
+    read_only_pragmas. Other database backends are left untouched. Safe to
+    call more than once, e.g. after changing SQLITE_PROFILE.
+
+    Args:
+        app: Flask application the engines belong to
+        db: The Flask-SQLAlchemy instance
+    """
+    pragmas = sqlite_pragmas(app)
+    with app.app_context():
+        for engine in db.engines.values():
+            if engine.dialect.name != 'sqlite':
+                continue
+            if engine not in _engine_pragmas:
+                _listen_for_connections(engine)
+            if is_read_only(engine):
+                _engine_pragmas[engine] = read_only_pragmas(pragmas)
+                engine.dispose()
+                continue  # The file may not exist until the primary creates it
+
+            _engine_pragmas[engine] = dict(pragmas)
+            engine.dispose()
+
+            if pragmas:
+                with engine.connect() as conn:
+                    journal_mode = conn.exec_driver_sql("PRAGMA journal_mode").scalar()
+                logger.info(
+                    f"SQLite profile '{app.config.get('SQLITE_PROFILE')}' applied to "
+                    f"{engine.url.database} (journal_mode={journal_mode})"
+                )
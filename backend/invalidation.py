@@ -0,0 +1,121 @@
+import logging
+from sqlalchemy import event
+from backend.model import User, Professional, Customer, Service, ServiceRequest, Review
+from backend.cache import invalidate_cache_prefix
+
+logger = logging.getLogger(__name__)
+
+# Cache namespaces built from each model's rows. An entry is either a namespace
+# or a callable returning the namespace of one row, for per-row detail entries.
+CACHE_DEPENDENCIES = {
+    Service: [
+        'services:list',
+        lambda service: f"services:detail:{service.id}",
+        'service_types',
+        'services:popular',
+        'service_requests',
+        'service_request:detail',
+        'service_catalog'
+    ],
+    ServiceRequest: [
+        'service_requests',
+        lambda service_request: f"service_request:detail:{service_request.id}",
+        'services:popular',
+        'admin:professionals',
+        'admin:customers'
+    ],
+    Review: [
+        'reviews',
+        lambda review: f"service_request:detail:{review.service_request_id}",
+        'service_requests',
+        'services:popular',
+        'admin:professionals',
+        'admin:customers'
+    ],
+    Professional: [
+        'services:list',
+        'service_requests',
+        'service_request:detail',
+        'admin:users',
+        'admin:professionals'
+    ],
+    Customer: [
+        'service_requests',
+        'service_request:detail',
+        'reviews',
+        'admin:users',
+        'admin:customers'
+    ],
+    User: [
+        'admin:users',
+        'admin:professionals',
+        'admin:customers'
+    ]
+}
+
+PENDING_KEY = 'cache_namespaces'
+
+def register_cache_dependency(model, *namespaces):
+    """
+    Declare additional cache namespaces that depend on a model.
+
+    Args:
+        model: The model class
+        namespaces: Namespaces, or callables mapping a row to its namespace
+    """
+    CACHE_DEPENDENCIES.setdefault(model, []).extend(namespaces)
+
+def namespaces_for(obj):
+    """Cache namespaces affected by a change to a row"""
+    namespaces = set()
+    for dependency in CACHE_DEPENDENCIES.get(type(obj), []):
+        namespace = dependency(obj) if callable(dependency) else dependency
+        if namespace:
+            namespaces.add(namespace)
+    return namespaces
+
+def collapse_namespaces(namespaces):
+    """Drop namespaces already covered by a broader one, e.g. "services:detail:5" by "services" """
+    return sorted(
+        ns for ns in namespaces
+        if not any(ns.startswith(other + ':') for other in namespaces)
+    )
+
+def _record_changes(session, flush_context):
+    pending = session.info.setdefault(PENDING_KEY, set())
+    for obj in session.new | session.deleted:
+        pending |= namespaces_for(obj)
+    for obj in session.dirty:
+        if session.is_modified(obj, include_collections=False):
+            pending |= namespaces_for(obj)
+
+def _invalidate_committed(session):
+    pending = session.info.pop(PENDING_KEY, None)
+    if pending:
+        for namespace in collapse_namespaces(pending):
+            invalidate_cache_prefix(namespace)
+        logger.debug(f"Invalidated cache namespaces after commit: {sorted(pending)}")
+
+def _discard_pending(session):
+    session.info.pop(PENDING_KEY, None)
+
+def init_cache_invalidation(db):
+    """
+    Invalidate cache namespaces automatically when rows are committed.
+
+    Changes are collected per session on every flush, using CACHE_DEPENDENCIES
+    to map each inserted, updated or deleted row to the namespaces built from
+    it, and invalidated once the transaction commits. Rolled back changes are
+    discarded. Safe to call more than once.
+
+    Args:
+        db: The Flask-SQLAlchemy instance whose sessions are watched
+    """
+    session = db.session
+    for name, listener in (
+        ('after_flush', _record_changes),
+        ('after_commit', _invalidate_committed),
+        ('after_rollback', _discard_pending)
+    ):
+        if not event.contains(session, name, listener):
+            event.listen(session, name, listener)
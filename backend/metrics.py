@@ -0,0 +1,133 @@
+import threading
+import time
+from collections import defaultdict
+
+# Upper bounds (milliseconds) of the latency histogram buckets
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+class Histogram:
+    """Fixed-bucket latency histogram in milliseconds"""
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)  # Last bucket is +Inf
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms):
+        index = len(LATENCY_BUCKETS_MS)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if ms <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, p):
+        """Upper bucket bound below which p percent of observations fall"""
+        if not self.count:
+            return None
+        threshold = self.count * p / 100
+        seen = 0
+        for bound, n in zip(LATENCY_BUCKETS_MS, self.counts):
+            seen += n
+            if seen >= threshold:
+                return bound
+        return round(self.max_ms, 3)
+
+    def to_dict(self):
+        bounds = list(LATENCY_BUCKETS_MS) + ['inf']
+        return {
+            'count': self.count,
+            'avg_ms': round(self.total_ms / self.count, 3) if self.count else None,
+            'max_ms': round(self.max_ms, 3),
+            'p50_ms': self.percentile(50),
+            'p95_ms': self.percentile(95),
+            'p99_ms': self.percentile(99),
+            'buckets': [{'le': bound, 'count': n} for bound, n in zip(bounds, self.counts)]
+        }
+
+class CacheMetrics:
+    """
+    Thread-safe cache counters and latency histograms, per prefix and tier.
+
+    Tiers are 'memory' and 'redis' for storage operations, and 'response' for
+    the outcome of each cached request (hit, stale, miss or bypass, plus
+    not_modified for hits and misses answered with 304).
+    Keys are attributed to the longest registered prefix they start with.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._prefixes = []
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started_at = time.time()
+            self._counters = defaultdict(lambda: defaultdict(lambda: defaultdict(int)))
+            self._latencies = defaultdict(lambda: defaultdict(Histogram))
+
+    def register_prefix(self, prefix):
+        with self._lock:
+            if prefix not in self._prefixes:
+                self._prefixes.append(prefix)
+                self._prefixes.sort(key=len, reverse=True)
+
+    def prefix_for(self, key):
+        """The registered prefix a cache key or namespace belongs to"""
+        for prefix in self._prefixes:
+            if key == prefix or key.startswith(prefix + ':'):
+                return prefix
+        return 'other'
+
+    def prefixes_under(self, namespace):
+        """Registered prefixes affected by invalidating a namespace"""
+        covered = [p for p in self._prefixes if p == namespace or p.startswith(namespace + ':')]
+        return covered or [self.prefix_for(namespace)]
+
+    def incr(self, prefix, tier, event, amount=1):
+        with self._lock:
+            self._counters[prefix][tier][event] += amount
+
+    def observe(self, prefix, tier, event, seconds):
+        with self._lock:
+            self._latencies[prefix][f"{tier}.{event}"].observe(seconds * 1000)
+
+    def snapshot(self):
+        """
+        Current counters and histograms.
+
+        Returns:
+            dict: 'prefixes' maps each prefix to its tier counters, hit ratio and
+            latency histograms; 'totals' sums the counters over all prefixes
+        """
+        with self._lock:
+            prefixes = {}
+            totals = defaultdict(lambda: defaultdict(int))
+            for prefix in sorted(set(self._counters) | set(self._latencies)):
+                tiers = {tier: dict(events) for tier, events in self._counters[prefix].items()}
+                for tier, events in tiers.items():
+                    for event, n in events.items():
+                        totals[tier][event] += n
+                prefixes[prefix] = dict(
+                    tiers,
+                    hit_ratio=_hit_ratio(tiers.get('response', {})),
+                    latency_ms={name: h.to_dict() for name, h in sorted(self._latencies[prefix].items())}
+                )
+
+            totals = {tier: dict(events) for tier, events in totals.items()}
+            return {
+                'since': self.started_at,
+                'uptime_seconds': round(time.time() - self.started_at, 1),
+                'totals': dict(totals, hit_ratio=_hit_ratio(totals.get('response', {}))),
+                'prefixes': prefixes
+            }
+
+def _hit_ratio(response_counts):
+    """Share of cached requests answered without calling the view"""
+    served = response_counts.get('hit', 0) + response_counts.get('stale', 0)
+    total = served + response_counts.get('miss', 0)
+    return round(served / total, 4) if total else None
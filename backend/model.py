@@ -1,7 +1,9 @@
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
+from backend.routing import RoutingSession
 
-db = SQLAlchemy()
+# Sessions route the queries of read_only resource methods to the read engine
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 
 # Define User model
 class User(db.Model):
@@ -17,14 +19,19 @@ class User(db.Model):
 
 # Define Professional model
 class Professional(db.Model):
+    __table_args__ = (
+        # Approved professionals per service type (service listing availability)
+        db.Index('ix_professional_service_type_approved', 'service_type', 'approved'),
+    )
+
     professional_id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
     user = db.relationship('User', back_populates='professional')
     name = db.Column(db.String, nullable=False)
     service_type = db.Column(db.String, nullable=False)
     mobile = db.Column(db.String)
     exp = db.Column(db.String)
-    pin = db.Column(db.Integer)
+    pin = db.Column(db.Integer, index=True)
     created_date = db.Column(db.DateTime, default=datetime.now)
     description = db.Column(db.String)
     approved = db.Column(db.Boolean, default=False)
@@ -32,7 +39,7 @@ class Professional(db.Model):
 
 class Customer(db.Model):
     customer_id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
     user = db.relationship('User', back_populates='customer')
     name = db.Column(db.String, nullable=False)
     address = db.Column(db.String, nullable=False)
@@ -51,8 +58,19 @@ class Service(db.Model):
 
 # Define ServiceRequest model
 class ServiceRequest(db.Model):
+    __table_args__ = (
+        # Professional dashboards: own requests by status, newest first
+        db.Index('ix_service_request_professional_status_date', 'professional_id', 'status', 'req_date'),
+        # Admin/open request listings filtered by status and date range
+        db.Index('ix_service_request_status_date', 'status', 'req_date'),
+        # Customer request history, newest first
+        db.Index('ix_service_request_customer_date', 'customer_id', 'req_date'),
+        # Date range filters and recent activity without a status filter
+        db.Index('ix_service_request_req_date', 'req_date'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
-    service_id = db.Column(db.Integer, db.ForeignKey('service.id'))
+    service_id = db.Column(db.Integer, db.ForeignKey('service.id'), index=True)
     customer_id = db.Column(db.Integer, db.ForeignKey('customer.customer_id'))
     professional_id = db.Column(db.Integer, db.ForeignKey('professional.professional_id'))
     req_date = db.Column(db.DateTime, default=datetime.now)
@@ -72,8 +90,8 @@ class ServiceRequest(db.Model):
 # Define Review model
 class Review(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    service_request_id = db.Column(db.Integer, db.ForeignKey('service_request.id'))
-    customer_id = db.Column(db.Integer, db.ForeignKey('customer.customer_id'))
+    service_request_id = db.Column(db.Integer, db.ForeignKey('service_request.id'), index=True)
+    customer_id = db.Column(db.Integer, db.ForeignKey('customer.customer_id'), index=True)
     rating = db.Column(db.Integer, nullable=False)
     comment = db.Column(db.String)
     date_created = db.Column(db.DateTime, default=datetime.now)
@@ -0,0 +1,497 @@
+import base64
+import json
+from datetime import datetime, timedelta
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+from backend.model import db, User, Professional, Customer, Service, ServiceRequest, Review
+from backend.search import use_search_index, search_rank_subquery, like_search_filter
+from backend.catalog import service_catalog
+
+# Bounds for keyset-paginated service request listings
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def load_service_requests(query, order_by=None, limit=None, search=None, rank_by_relevance=False):
+    """
+    Load service requests together with their related rows in a single statement.
+
+    Requests without a valid service are dropped by the inner join, customers and
+    professionals are outer-joined, and review existence is an EXISTS subquery.
+    Services are taken from the in-process catalog rather than loaded per row
+    (see resolve_services).
+    A search term is matched in SQL against the service name, customer name and
+    remarks, through the FTS5 index when available and LIKE otherwise.
+
+    Args:
+        query: A ServiceRequest query with filters already applied
+        order_by (list): ORDER BY clauses (default: ServiceRequest.id)
+        limit (int): Optional maximum number of rows to load
+        search (str): Optional free-text search term
+        rank_by_relevance (bool): Order FTS5 matches by relevance ahead of the
+            last ORDER BY clause (the tie-breaker)
+
+    Returns:
+        list: Tuples of (service_request, service, customer, professional, has_review)
+    """
+    has_review = db.session.query(Review.id).filter(
+        Review.service_request_id == ServiceRequest.id
+    ).exists()
+
+    query = query.join(
+        Service, ServiceRequest.service_id == Service.id
+    ).outerjoin(
+        Customer, ServiceRequest.customer_id == Customer.customer_id
+    ).outerjoin(
+        Professional, ServiceRequest.professional_id == Professional.professional_id
+    ).add_entity(Customer).add_entity(Professional).add_columns(
+        has_review.label('has_review')
+    )
+
+    order_by = list(order_by or [ServiceRequest.id])
+
+    if search:
+        if use_search_index(search):
+            matches = search_rank_subquery(search)
+            query = query.join(matches, matches.c.request_id == ServiceRequest.id)
+            if rank_by_relevance:
+                order_by.insert(len(order_by) - 1, matches.c.rank)
+        else:
+            query = query.filter(like_search_filter(search))
+
+    query = query.order_by(*order_by)
+
+    if limit:
+        query = query.limit(limit)
+
+    rows = query.all()
+    services = resolve_services(req.service_id for req, *_ in rows)
+    return [
+        (req, services[req.service_id], customer, professional, has_review)
+        for req, customer, professional, has_review in rows
+    ]
+
+
+def resolve_services(service_ids):
+    """
+    Look up services by id in the catalog.
+
+    A snapshot can lag behind the database, e.g. when another worker created
+    a service and no broker delivered its invalidation. Ids missing from the
+    snapshot rebuild it once, and any still missing (uncommitted in this
+    session) are loaded through the session.
+
+    Args:
+        service_ids (iterable): Service ids; None values are ignored
+
+    Returns:
+        dict: Mapping of service id to ServiceRecord or Service; ids that do
+        not exist are absent
+    """
+    service_ids = {i for i in service_ids if i is not None}
+    catalog = service_catalog.snapshot()
+    services = {i: catalog.get(i) for i in service_ids}
+    missing = [i for i, service in services.items() if service is None]
+
+    if missing:
+        catalog = service_catalog.refresh(catalog)
+        services.update((i, catalog.get(i)) for i in missing)
+        missing = [i for i in missing if services[i] is None]
+        services.update(load_by_ids(Service, missing))
+
+    return {i: service for i, service in services.items() if service is not None}
+
+
+class date_of(FunctionElement):
+    """
+    Calendar date of a DateTime column: CAST(column AS DATE), except on SQLite,
+    which has no DATE type and uses its date() function instead.
+    """
+    type = db.Date()
+    inherit_cache = True
+    name = 'date_of'
+
+
+@compiles(date_of)
+def _compile_date_of(element, compiler, **kw):
+    return f"CAST({compiler.process(element.clauses, **kw)} AS DATE)"
+
+
+@compiles(date_of, 'sqlite')
+def _compile_date_of_sqlite(element, compiler, **kw):
+    return f"date({compiler.process(element.clauses, **kw)})"
+
+
+def average(column):
+    """AVG() as a float on every backend (PostgreSQL returns NUMERIC, i.e. Decimal)"""
+    return db.cast(db.func.avg(column), db.Float)
+
+
+def requested_first():
+    """SQL sort bucket that puts open ('requested') service requests first"""
+    return db.case((ServiceRequest.status == 'requested', 0), else_=1)
+
+
+def encode_cursor(bucket, req_date, request_id):
+    """Encode a keyset position as an opaque URL-safe cursor string; req_date may be None"""
+    payload = json.dumps([bucket, req_date.isoformat() if req_date is not None else None, request_id])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """
+    Decode a cursor produced by encode_cursor
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        bucket, req_date, request_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        req_date = datetime.fromisoformat(req_date) if req_date is not None else None
+        return int(bucket), req_date, int(request_id)
+    except (TypeError, ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f'Invalid cursor: {cursor}') from e
+
+
+def load_service_request_page(query, cursor=None, page_size=DEFAULT_PAGE_SIZE, prioritize_requested=False, search=None):
+    """
+    Load one page of service requests using keyset pagination on (req_date, id).
+
+    Pages are ordered newest first, with undated requests last. When
+    prioritize_requested is set, open requests come before all others and the
+    bucket is part of the keyset, so the ordering stays stable across pages.
+    Search matches are filtered but not ranked, since relevance cannot be part
+    of the keyset.
+
+    Args:
+        query: A ServiceRequest query with filters already applied
+        cursor (str): Cursor returned with the previous page, or None for the first page
+        page_size (int): Number of rows per page
+        prioritize_requested (bool): Put 'requested' service requests first
+        search (str): Optional free-text search term
+
+    Returns:
+        tuple: (rows as returned by load_service_requests, next_cursor or None)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    bucket = requested_first() if prioritize_requested else db.literal(0)
+
+    if cursor:
+        after_bucket, after_date, after_id = decode_cursor(cursor)
+        if after_date is None:
+            # Past the dated rows: only older undated ones remain
+            before_in_bucket = db.and_(ServiceRequest.req_date.is_(None), ServiceRequest.id < after_id)
+        else:
+            before_in_bucket = db.or_(
+                ServiceRequest.req_date < after_date,
+                db.and_(ServiceRequest.req_date == after_date, ServiceRequest.id < after_id),
+                ServiceRequest.req_date.is_(None)
+            )
+        if prioritize_requested:
+            query = query.filter(db.or_(
+                bucket > after_bucket,
+                db.and_(bucket == after_bucket, before_in_bucket)
+            ))
+        else:
+            query = query.filter(before_in_bucket)
+
+    # NULLS LAST is explicit since PostgreSQL sorts NULLs first in descending order
+    order_by = [ServiceRequest.req_date.desc().nulls_last(), ServiceRequest.id.desc()]
+    if prioritize_requested:
+        order_by.insert(0, bucket)
+
+    # Fetch one extra row to know whether another page exists
+    rows = load_service_requests(query, order_by=order_by, limit=page_size + 1, search=search)
+
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1][0]
+        last_bucket = 0 if not prioritize_requested or last.status == 'requested' else 1
+        next_cursor = encode_cursor(last_bucket, last.req_date, last.id)
+
+    return rows, next_cursor
+
+
+def load_popular_services(limit=5, service_type=None):
+    """
+    Rank services by popularity with one grouped aggregate.
+
+    Request counts and review ratings are aggregated per service in subqueries,
+    and the popularity score (70% request volume, 30% scaled average rating) is
+    computed and ordered in SQL so only the top rows are returned; the services
+    themselves come from the in-process catalog.
+
+    Args:
+        limit (int): Maximum number of services to return
+        service_type (str): Optional service type to restrict the ranking to
+
+    Returns:
+        list: Tuples of (service, request_count, avg_rating, rating_count)
+    """
+    request_counts = db.session.query(
+        ServiceRequest.service_id.label('service_id'),
+        db.func.count(ServiceRequest.id).label('request_count')
+    ).group_by(ServiceRequest.service_id).subquery()
+
+    rating_stats = db.session.query(
+        ServiceRequest.service_id.label('service_id'),
+        average(Review.rating).label('avg_rating'),
+        db.func.count(Review.id).label('rating_count')
+    ).select_from(Review).join(
+        ServiceRequest, Review.service_request_id == ServiceRequest.id
+    ).group_by(ServiceRequest.service_id).subquery()
+
+    request_count = db.func.coalesce(request_counts.c.request_count, 0)
+    avg_rating = db.func.coalesce(rating_stats.c.avg_rating, 0)
+    rating_count = db.func.coalesce(rating_stats.c.rating_count, 0)
+    popularity_score = (request_count * 0.7) + (avg_rating * 0.3 * 10)
+
+    query = db.session.query(
+        Service.id, request_count, avg_rating, rating_count
+    ).outerjoin(
+        request_counts, request_counts.c.service_id == Service.id
+    ).outerjoin(
+        rating_stats, rating_stats.c.service_id == Service.id
+    )
+
+    if service_type:
+        query = query.filter(Service.service_type == service_type)
+
+    rows = query.order_by(popularity_score.desc(), Service.id).limit(limit).all()
+
+    services = resolve_services(service_id for service_id, *_ in rows)
+    return [
+        (services[service_id], *stats)
+        for service_id, *stats in rows
+        if service_id in services
+    ]
+
+
+def load_status_counts(query, statuses):
+    """
+    Count service requests in total and per status with one conditional aggregate.
+
+    Args:
+        query: A ServiceRequest query with filters already applied
+        statuses (list): Statuses to count individually
+
+    Returns:
+        dict: {'total': n, <status>: n, ...}
+    """
+    columns = [db.func.count(ServiceRequest.id)]
+    for status in statuses:
+        columns.append(db.func.coalesce(
+            db.func.sum(db.case((ServiceRequest.status == status, 1), else_=0)), 0
+        ))
+
+    row = query.with_entities(*columns).one()
+
+    counts = {'total': row[0]}
+    for status, count in zip(statuses, row[1:]):
+        counts[status] = count
+    return counts
+
+
+def load_recent_activity(query, limit=5):
+    """
+    Load the most recent service requests with their service and customer names.
+
+    Args:
+        query: A ServiceRequest query with filters already applied
+        limit (int): Number of requests to return
+
+    Returns:
+        list: Tuples of (service_request, service_name, customer_name); names are
+        None when the service or customer no longer exists
+    """
+    rows = query.outerjoin(
+        Customer, ServiceRequest.customer_id == Customer.customer_id
+    ).add_columns(
+        Customer.name
+    ).order_by(
+        ServiceRequest.req_date.desc(), ServiceRequest.id.desc()
+    ).limit(limit).all()
+
+    services = resolve_services(req.service_id for req, _ in rows)
+    return [
+        (req, getattr(services.get(req.service_id), 'name', None), customer_name)
+        for req, customer_name in rows
+    ]
+
+
+def load_daily_counts(query, days):
+    """
+    Count service requests per day over the last N days with one GROUP BY.
+
+    Days without requests are included with zero counts so the series can be
+    plotted directly.
+
+    Args:
+        query: A ServiceRequest query with filters already applied
+        days (int): Number of days to include, ending today
+
+    Returns:
+        list: Dicts of {'date', 'total', 'completed'} ordered oldest first
+    """
+    today = datetime.now().date()
+    start = today - timedelta(days=days - 1)
+    day = date_of(ServiceRequest.req_date)
+
+    rows = query.filter(
+        ServiceRequest.req_date >= datetime.combine(start, datetime.min.time())
+    ).with_entities(
+        day,
+        db.func.count(ServiceRequest.id),
+        db.func.coalesce(db.func.sum(db.case((ServiceRequest.status == 'closed', 1), else_=0)), 0)
+    ).group_by(day).all()
+
+    by_day = {str(date): (total, completed) for date, total, completed in rows}
+
+    series = []
+    for offset in range(days):
+        date = (start + timedelta(days=offset)).strftime('%Y-%m-%d')
+        total, completed = by_day.get(date, (0, 0))
+        series.append({'date': date, 'total': total, 'completed': completed})
+    return series
+
+
+def professional_stats_query():
+    """
+    Build a query of every professional with its user and request/review statistics.
+
+    Per-professional totals, completed counts and average ratings come from
+    grouped subqueries joined to Professional and User, so filtering, sorting and
+    pagination can all be applied in SQL.
+
+    Returns:
+        Query: Rows of (professional, user, total_requests, completed_requests, average_rating)
+    """
+    request_stats = db.session.query(
+        ServiceRequest.professional_id.label('professional_id'),
+        db.func.count(ServiceRequest.id).label('total_requests'),
+        db.func.sum(db.case((ServiceRequest.status == 'closed', 1), else_=0)).label('completed_requests')
+    ).group_by(ServiceRequest.professional_id).subquery()
+
+    rating_stats = db.session.query(
+        ServiceRequest.professional_id.label('professional_id'),
+        average(Review.rating).label('average_rating')
+    ).select_from(Review).join(
+        ServiceRequest, Review.service_request_id == ServiceRequest.id
+    ).group_by(ServiceRequest.professional_id).subquery()
+
+    return db.session.query(
+        Professional,
+        User,
+        db.func.coalesce(request_stats.c.total_requests, 0).label('total_requests'),
+        db.func.coalesce(request_stats.c.completed_requests, 0).label('completed_requests'),
+        db.func.coalesce(rating_stats.c.average_rating, 0).label('average_rating')
+    ).join(
+        User, Professional.user_id == User.id
+    ).outerjoin(
+        request_stats, request_stats.c.professional_id == Professional.professional_id
+    ).outerjoin(
+        rating_stats, rating_stats.c.professional_id == Professional.professional_id
+    )
+
+
+def customer_stats_query():
+    """
+    Build a query of every customer with its user and request/review counts.
+
+    Per-customer totals, completed counts and review counts come from grouped
+    subqueries joined to Customer and User, so filtering, sorting and pagination
+    can all be applied in SQL.
+
+    Returns:
+        Query: Rows of (customer, user, total_requests, completed_requests, reviews_count)
+    """
+    request_stats = db.session.query(
+        ServiceRequest.customer_id.label('customer_id'),
+        db.func.count(ServiceRequest.id).label('total_requests'),
+        db.func.sum(db.case((ServiceRequest.status == 'closed', 1), else_=0)).label('completed_requests')
+    ).group_by(ServiceRequest.customer_id).subquery()
+
+    review_stats = db.session.query(
+        Review.customer_id.label('customer_id'),
+        db.func.count(Review.id).label('reviews_count')
+    ).group_by(Review.customer_id).subquery()
+
+    return db.session.query(
+        Customer,
+        User,
+        db.func.coalesce(request_stats.c.total_requests, 0).label('total_requests'),
+        db.func.coalesce(request_stats.c.completed_requests, 0).label('completed_requests'),
+        db.func.coalesce(review_stats.c.reviews_count, 0).label('reviews_count')
+    ).join(
+        User, Customer.user_id == User.id
+    ).outerjoin(
+        request_stats, request_stats.c.customer_id == Customer.customer_id
+    ).outerjoin(
+        review_stats, review_stats.c.customer_id == Customer.customer_id
+    )
+
+
+def user_profiles_query():
+    """
+    Build a query of users outer-joined to their professional or customer profile.
+
+    Nothing stops a user from having several profiles, so only the one with
+    the lowest id is joined (a correlated MIN per user, served by the user_id
+    index) and each user appears once.
+
+    Returns:
+        Query: Rows of (user, professional or None, customer or None)
+    """
+    other_professional = db.aliased(Professional)
+    first_professional = db.select(db.func.min(other_professional.professional_id)).where(
+        other_professional.user_id == User.id
+    ).correlate(User).scalar_subquery()
+
+    other_customer = db.aliased(Customer)
+    first_customer = db.select(db.func.min(other_customer.customer_id)).where(
+        other_customer.user_id == User.id
+    ).correlate(User).scalar_subquery()
+
+    return db.session.query(User, Professional, Customer).select_from(User).outerjoin(
+        Professional, db.and_(
+            Professional.professional_id == first_professional, User.role == 'professional'
+        )
+    ).outerjoin(
+        Customer, db.and_(Customer.customer_id == first_customer, User.role == 'customer')
+    )
+
+
+def load_by_ids(model, ids):
+    """
+    Load rows of a model by primary key with a single IN query.
+
+    Args:
+        model: The model class to load
+        ids (iterable): Primary key values; None values are ignored
+
+    Returns:
+        dict: Mapping of primary key value to row
+    """
+    ids = {i for i in ids if i is not None}
+    if not ids:
+        return {}
+
+    primary_key = db.inspect(model).primary_key[0]
+    rows = model.query.filter(primary_key.in_(ids)).all()
+    return {getattr(row, primary_key.key): row for row in rows}
+
+
+def load_rating_summary(query):
+    """
+    Count reviews and average their ratings with one aggregate query.
+
+    Args:
+        query: A Review query with filters already applied
+
+    Returns:
+        tuple: (review_count, average_rating or None)
+    """
+    return query.with_entities(db.func.count(Review.id), average(Review.rating)).one()
@@ -0,0 +1,181 @@
+import logging
+import os
+import threading
+import time
+import weakref
+import redis
+
+logger = logging.getLogger(__name__)
+
+class CircuitOpenError(redis.exceptions.ConnectionError):
+    """Raised instead of calling Redis while the circuit breaker is open"""
+
+class RedisCircuitBreaker:
+    """
+    Circuit breaker guarding every Redis call of the process.
+
+    The circuit is closed while Redis is healthy. After failure_threshold
+    consecutive connection errors or timeouts it opens: calls fail immediately
+    instead of waiting for socket timeouts, and a background thread probes Redis
+    with exponential backoff, closing the circuit again once a probe succeeds.
+    The circuit starts open and is closed by the first successful probe.
+    """
+    CLOSED = 'closed'
+    OPEN = 'open'
+
+    def __init__(self, probe, failure_threshold=3, reset_timeout=1.0, max_reset_timeout=30.0, on_close=None):
+        """
+        Args:
+            probe: Callable that raises if Redis is unreachable, e.g. client.ping
+            failure_threshold (int): Consecutive failures that open the circuit
+            reset_timeout (float): Seconds before the first reconnection probe
+            max_reset_timeout (float): Upper bound of the probe backoff in seconds
+            on_close: Optional callable run whenever the circuit closes
+        """
+        self._probe = probe
+        self.on_close = on_close
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self._lock = threading.Lock()
+        self._reconnecting = False
+        self.state = self.OPEN
+        self.consecutive_failures = 0
+        self.trips = 0
+        self.last_error = None
+        self.opened_at = time.time()
+
+        after_fork = weakref.WeakMethod(self._after_fork)
+        os.register_at_fork(after_in_child=lambda: after_fork() and after_fork()())
+
+    def allow(self):
+        """Return True if calls may go to Redis"""
+        return self.state == self.CLOSED
+
+    def record_success(self):
+        self.consecutive_failures = 0
+
+    def record_failure(self, error):
+        with self._lock:
+            self.consecutive_failures += 1
+            self.last_error = str(error)
+            if self.state == self.CLOSED and self.consecutive_failures >= self.failure_threshold:
+                self._open()
+
+    def probe(self):
+        """
+        Check Redis now, closing the circuit if it responds.
+
+        Returns:
+            bool: True if Redis is reachable
+        """
+        try:
+            self._probe()
+        except Exception as e:
+            self.last_error = str(e)
+            return False
+
+        with self._lock:
+            closed = self.state != self.CLOSED
+            if closed:
+                self.state = self.CLOSED
+                self.consecutive_failures = 0
+                logger.info("Redis connection restored, circuit closed")
+
+        if closed and self.on_close:
+            try:
+                self.on_close()
+            except Exception as e:
+                logger.warning(f"Redis reconnect hook failed: {e}")
+        return True
+
+    def start(self):
+        """Probe Redis in the background until the circuit closes"""
+        with self._lock:
+            self._start_reconnect(initial_delay=0)
+
+    def stats(self):
+        return {
+            'state': self.state,
+            'consecutive_failures': self.consecutive_failures,
+            'trips': self.trips,
+            'last_error': self.last_error,
+            'open_for_seconds': round(time.time() - self.opened_at, 1) if self.state == self.OPEN else 0
+        }
+
+    def _after_fork(self):
+        # Runs in a forked child (e.g. a worker of a preloading server), which
+        # inherits the state but neither the reconnection thread nor a lock
+        # another thread may have held
+        self._lock = threading.Lock()
+        self._reconnecting = False
+        if self.state == self.OPEN:
+            with self._lock:
+                self._start_reconnect(initial_delay=0)
+
+    def _open(self):
+        # Caller holds the lock
+        self.state = self.OPEN
+        self.trips += 1
+        self.opened_at = time.time()
+        logger.warning(f"Redis circuit opened after {self.consecutive_failures} failures: {self.last_error}")
+        self._start_reconnect(initial_delay=self.reset_timeout)
+
+    def _start_reconnect(self, initial_delay):
+        # Caller holds the lock; one reconnection thread at a time
+        if self._reconnecting:
+            return
+        self._reconnecting = True
+        thread = threading.Thread(
+            target=self._reconnect_loop, args=(initial_delay,),
+            name='redis-reconnect', daemon=True
+        )
+        thread.start()
+
+    def _reconnect_loop(self, delay):
+        try:
+            while self.state == self.OPEN:
+                time.sleep(delay)
+                if self.probe():
+                    break
+                delay = min(max(delay * 2, self.reset_timeout), self.max_reset_timeout)
+        finally:
+            with self._lock:
+                self._reconnecting = False
+                # The circuit may have opened again while this thread was exiting
+                if self.state == self.OPEN:
+                    self._start_reconnect(initial_delay=self.reset_timeout)
+
+class GuardedRedis:
+    """
+    Proxy to a Redis client that reports call outcomes to a circuit breaker.
+
+    While the circuit is open, calls raise CircuitOpenError without touching
+    the network. Connection errors and timeouts count as failures; other errors
+    (e.g. a bad command) are Redis answering and count as successes.
+    """
+
+    def __init__(self, client, breaker):
+        self.client = client
+        self.breaker = breaker
+
+    def __getattr__(self, name):
+        attr = getattr(self.client, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            if not self.breaker.allow():
+                raise CircuitOpenError("Redis circuit is open")
+            try:
+                result = attr(*args, **kwargs)
+            except (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError) as e:
+                self.breaker.record_failure(e)
+                raise
+            except redis.exceptions.RedisError:
+                self.breaker.record_success()
+                raise
+            self.breaker.record_success()
+            return result
+
+        return call
@@ -7,7 +7,16 @@ from flask_jwt_extended import (
 )
 from werkzeug.security import generate_password_hash, check_password_hash
 from backend.model import db, User, Professional, Customer, Service, ServiceRequest, Review
-from backend.cache import cache_response, invalidate_cache_prefix
+from backend.cache import cache_response
+from backend.catalog import service_catalog
+from backend.routing import read_only
+from backend.queries import (
+    load_service_requests, load_service_request_page, load_popular_services,
+    load_status_counts, load_recent_activity, load_daily_counts,
+    professional_stats_query, customer_stats_query, user_profiles_query,
+    load_by_ids, load_rating_summary, date_of,
+    requested_first, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+)
 from datetime import datetime, timedelta
 
 # Authentication Resources
@@ -54,7 +63,10 @@ class UserRegistration(Resource):
                 
             db.session.commit()
             
-            access_token = create_access_token(identity=str(new_user.id))
+            access_token = create_access_token(
+                identity=str(new_user.id),
+                additional_claims={'role': new_user.role}
+            )
             refresh_token = create_refresh_token(identity=str(new_user.id))
             
             return {
@@ -80,7 +92,10 @@ class UserLogin(Resource):
         if not user.active:
             return {'message': 'User is deactivated'}, 401
             
-        access_token = create_access_token(identity=str(user.id))
+        access_token = create_access_token(
+            identity=str(user.id),
+            additional_claims={'role': user.role}
+        )
         refresh_token = create_refresh_token(identity=str(user.id))
         return {
             'access_token': access_token,
@@ -104,6 +119,7 @@ class TokenRefresh(Resource):
             expires = timedelta(hours=1)
             new_access_token = create_access_token(
                 identity=current_user,
+                additional_claims={'role': user.role},
                 expires_delta=expires
             )
             
@@ -127,22 +143,29 @@ class ServiceListResource(Resource):
         search_type = request.args.get('type')
         search_pin = request.args.get('pin')
         
-        # Base query
-        query = Service.query
+        # Services come from the in-process catalog snapshot, filtered here
+        services = service_catalog.snapshot().services
         
-        # Apply filters if provided
+        # Apply filters if provided (case-insensitive substring match, like ILIKE)
         if search_name:
-            query = query.filter(Service.name.ilike(f'%{search_name}%'))
+            search_name = search_name.lower()
+            services = [s for s in services if search_name in s.name.lower()]
         if search_type:
-            query = query.filter(Service.service_type.ilike(f'%{search_type}%'))
+            search_type = search_type.lower()
+            services = [s for s in services if search_type in s.service_type.lower()]
         if search_pin:
             # For pin search, find professionals in that area and their service types
             professionals = Professional.query.filter_by(pin=search_pin).all()
             if professionals:
-                service_types = [p.service_type for p in professionals]
-                query = query.filter(Service.service_type.in_(service_types))
+                service_types = {p.service_type for p in professionals}
+                services = [s for s in services if s.service_type in service_types]
+        
+        # Service types with at least one approved professional, in one query
+        available_types = {
+            row[0] for row in db.session.query(Professional.service_type)
+            .filter_by(approved=True).distinct()
+        }
         
-        services = query.all()
         result = []
         for service in services:
             result.append({
@@ -152,11 +175,8 @@ class ServiceListResource(Resource):
                 'time_req': service.time_req,
                 'description': service.description,
                 'service_type': service.service_type,
-                # Add availability info based on professional count
-                'has_professionals': Professional.query.filter_by(
-                    service_type=service.service_type, 
-                    approved=True
-                ).count() > 0
+                # Add availability info based on approved professionals
+                'has_professionals': service.service_type in available_types
             })
         return result, 200
     
@@ -182,8 +202,6 @@ class ServiceListResource(Resource):
         try:
             db.session.add(new_service)
             db.session.commit()
-            # Invalidate service cache after adding a new service
-            invalidate_cache_prefix("services:")
             return {
                 'message': 'Service created successfully',
                 'id': new_service.id
@@ -195,7 +213,7 @@ class ServiceListResource(Resource):
 class ServiceResource(Resource):
     @cache_response(prefix="services:detail", expire=600)  # Cache for 10 minutes
     def get(self, service_id):
-        service = Service.query.get(service_id)
+        service = service_catalog.get(service_id)
         if not service:
             return {'message': 'Service not found'}, 404
             
@@ -231,9 +249,6 @@ class ServiceResource(Resource):
         
         try:
             db.session.commit()
-            # Invalidate specific service cache and service list cache
-            invalidate_cache_prefix(f"services:detail:{service_id}")
-            invalidate_cache_prefix("services:list")
             return {'message': 'Service updated successfully'}, 200
         except:
             db.session.rollback()
@@ -255,9 +270,6 @@ class ServiceResource(Resource):
         try:
             db.session.delete(service)
             db.session.commit()
-            # Invalidate service caches
-            invalidate_cache_prefix(f"services:detail:{service_id}")
-            invalidate_cache_prefix("services:list")
             return {'message': 'Service deleted'}, 200
         except:
             db.session.rollback()
@@ -266,7 +278,7 @@ class ServiceResource(Resource):
 # Service Request Resources
 class ServiceRequestListResource(Resource):
     @jwt_required()
-    @cache_response(prefix="service_requests", expire=300)  # Cache for 5 minutes
+    @cache_response(prefix="service_requests", expire=300, vary_on="identity")  # Cache for 5 minutes, per user
     def get(self):
         user_id = get_jwt_identity()
         user = User.query.get(int(user_id))
@@ -281,6 +293,16 @@ class ServiceRequestListResource(Resource):
         search_term = request.args.get('search')
         limit = request.args.get('limit', type=int)
         role_param = request.args.get('role')  # Role parameter
+        cursor = request.args.get('cursor')
+        page_size = request.args.get('page_size', type=int)
+        
+        # Keyset pagination is used when a cursor or page size is requested
+        paginate = cursor is not None or page_size is not None
+        if paginate:
+            if page_size is None:
+                page_size = DEFAULT_PAGE_SIZE
+            if page_size < 1 or page_size > MAX_PAGE_SIZE:
+                return {'message': f'page_size must be between 1 and {MAX_PAGE_SIZE}'}, 400
         
         # Convert date strings to datetime objects if provided
         from_date = None
@@ -323,7 +345,7 @@ class ServiceRequestListResource(Resource):
         # Apply role-specific filters
         if effective_role == 'admin':
             # Admin can see all service requests
-            service_requests = base_query.all()
+            requests_query = base_query
         elif effective_role == 'professional':
             # Professional can see requests assigned to them and open requests
             if user.role == 'professional':
@@ -333,18 +355,18 @@ class ServiceRequestListResource(Resource):
                     
                 # If professional is approved, they can see requested services
                 if professional.approved:
-                    service_requests = base_query.filter(
+                    requests_query = base_query.filter(
                         (ServiceRequest.professional_id == professional.professional_id) | 
                         (ServiceRequest.status == 'requested')
-                    ).all()
+                    )
                 else:
                     # If not approved, they can only see their own requests
-                    service_requests = base_query.filter_by(
+                    requests_query = base_query.filter_by(
                         professional_id=professional.professional_id
-                    ).all()
+                    )
             else:
                 # Admin viewing as professional sees all requests
-                service_requests = base_query.all()
+                requests_query = base_query
                     
         elif effective_role == 'customer':
             # Customer can see their own requests
@@ -353,42 +375,43 @@ class ServiceRequestListResource(Resource):
                 if not customer:
                     return {'message': 'Customer profile not found'}, 404
                     
-                service_requests = base_query.filter_by(customer_id=customer.customer_id).all()
+                requests_query = base_query.filter_by(customer_id=customer.customer_id)
             else:
                 # Admin viewing as customer sees all requests
-                service_requests = base_query.all()
+                requests_query = base_query
         else:
             return {'message': 'Invalid role'}, 400
         
+        # For professionals, prioritize requested (available) services first in the result
+        prioritize_requested = effective_role == 'professional'
+        
+        # Load requests with their service, customer, professional and review flag
+        # in one statement; requests without a valid service are dropped in SQL
+        next_cursor = None
+        if paginate:
+            try:
+                service_requests, next_cursor = load_service_request_page(
+                    requests_query, cursor, page_size, prioritize_requested, search_term
+                )
+            except ValueError:
+                return {'message': 'Invalid cursor'}, 400
+        else:
+            order_by = [ServiceRequest.id]
+            if prioritize_requested:
+                order_by.insert(0, requested_first())
+            
+            # Search matches are ranked by relevance, then by id
+            service_requests = load_service_requests(
+                requests_query,
+                order_by=order_by,
+                limit=limit if limit and limit > 0 else None,
+                search=search_term,
+                rank_by_relevance=True
+            )
+        
         result = []
-        for req in service_requests:
+        for req, service, customer, professional, has_review in service_requests:
             try:
-                # Check if service_id is valid before querying
-                if req.service_id is None:
-                    # Skip service requests with NULL service_id
-                    continue
-                    
-                service = Service.query.get(req.service_id)
-                
-                # Skip if service doesn't exist
-                if not service:
-                    continue
-                    
-                customer = None
-                if req.customer_id:
-                    customer = Customer.query.get(req.customer_id)
-                
-                # Skip if doesn't match search term
-                if search_term:
-                    service_name = service.name.lower() if service else ""
-                    customer_name = customer.name.lower() if customer else ""
-                    remarks_text = req.remarks.lower() if req.remarks else ""
-                    
-                    if (search_term.lower() not in service_name and 
-                        search_term.lower() not in customer_name and
-                        search_term.lower() not in remarks_text):
-                        continue
-                
                 req_data = {
                     'id': req.id,
                     'service_id': req.service_id,
@@ -406,7 +429,6 @@ class ServiceRequestListResource(Resource):
                 }
                 
                 if req.professional_id:
-                    professional = Professional.query.get(req.professional_id)
                     req_data['professional_id'] = req.professional_id
                     req_data['professional_name'] = professional.name if professional else None
                 
@@ -414,8 +436,7 @@ class ServiceRequestListResource(Resource):
                     req_data['comp_date'] = req.comp_date.strftime('%Y-%m-%d %H:%M:%S')
                 
                 # Check if the request has reviews
-                has_review = Review.query.filter_by(service_request_id=req.id).first() is not None
-                req_data['has_review'] = has_review
+                req_data['has_review'] = bool(has_review)
                 
                 result.append(req_data)
             except Exception as e:
@@ -423,13 +444,12 @@ class ServiceRequestListResource(Resource):
                 print(f"Error processing request {req.id}: {str(e)}")
                 continue
         
-        # For professionals, prioritize requested (available) services first in the result
-        if effective_role == 'professional':
-            result.sort(key=lambda x: 0 if x['status'] == 'requested' else 1)
-            
-        # Apply limit if provided
-        if limit and isinstance(limit, int) and limit > 0:
-            result = result[:limit]
+        if paginate:
+            return {
+                'count': len(result),
+                'requests': result,
+                'next_cursor': next_cursor
+            }, 200
             
         return {
             'count': len(result),
@@ -460,8 +480,6 @@ class ServiceRequestListResource(Resource):
         try:
             db.session.add(new_request)
             db.session.commit()
-            # Invalidate service request cache
-            invalidate_cache_prefix("service_requests")
             return {
                 'message': 'Service request created successfully',
                 'id': new_request.id
@@ -472,7 +490,7 @@ class ServiceRequestListResource(Resource):
 
 class ServiceRequestResource(Resource):
     @jwt_required()
-    @cache_response(prefix="service_request:detail", expire=300)  # Cache for 5 minutes
+    @cache_response(prefix="service_request:detail", expire=300, vary_on="identity")  # Cache for 5 minutes, per user
     def get(self, request_id):
         service_request = ServiceRequest.query.get(request_id)
         if not service_request:
@@ -508,7 +526,7 @@ class ServiceRequestResource(Resource):
         else:
             return {'message': 'Invalid user role'}, 403
         
-        service = Service.query.get(service_request.service_id)
+        service = service_catalog.get(service_request.service_id)
         customer = Customer.query.get(service_request.customer_id)
         
         result = {
@@ -611,9 +629,6 @@ class ServiceRequestResource(Resource):
                 
         try:
             db.session.commit()
-            # Invalidate service request caches
-            invalidate_cache_prefix(f"service_request:detail:{request_id}")
-            invalidate_cache_prefix("service_requests")
             
             # Return updated service request details
             return {
@@ -653,9 +668,6 @@ class ServiceRequestResource(Resource):
         try:
             db.session.delete(service_request)
             db.session.commit()
-            # Invalidate service request caches
-            invalidate_cache_prefix(f"service_request:detail:{request_id}")
-            invalidate_cache_prefix("service_requests")
             return {'message': 'Service request deleted'}, 200
         except:
             db.session.rollback()
@@ -729,8 +741,6 @@ class ReviewListResource(Resource):
         try:
             db.session.add(new_review)
             db.session.commit()
-            # Invalidate review caches
-            invalidate_cache_prefix("reviews")
             return {
                 'message': 'Review submitted successfully',
                 'id': new_review.id
@@ -742,7 +752,8 @@ class ReviewListResource(Resource):
 # User Management Resources (Admin)
 class UserListResource(Resource):
     @jwt_required()
-    @cache_response(prefix="admin:users", expire=300)  # Cache for 5 minutes
+    @cache_response(prefix="admin:users", expire=300, vary_on="role")  # Cache for 5 minutes, per role
+    @read_only
     def get(self):
         user_id = get_jwt_identity()
         user = User.query.get(int(user_id))
@@ -756,29 +767,61 @@ class UserListResource(Resource):
         search_email = request.args.get('email')
         search_service_type = request.args.get('service_type')
         search_status = request.args.get('status')  # active, blocked, pending
+        page = request.args.get('page', type=int)
+        page_size = request.args.get('page_size', type=int)
         
-        # Base query
-        users_query = User.query
+        # Users with their professional/customer profile in one statement
+        users_query = user_profiles_query()
         
         # Apply filters
         if search_role:
-            users_query = users_query.filter_by(role=search_role)
+            users_query = users_query.filter(User.role == search_role)
             
         if search_email:
             users_query = users_query.filter(User.email.ilike(f'%{search_email}%'))
             
-        # Get all users first before additional filtering
-        users = users_query.all()
+        if search_status == 'active':
+            users_query = users_query.filter(User.active.is_(True))
+        elif search_status == 'blocked':
+            users_query = users_query.filter(User.active.isnot(True))
+        elif search_status == 'pending':
+            # Only professional profiles are excluded once approved
+            users_query = users_query.filter(db.or_(
+                Professional.professional_id.is_(None), Professional.approved.isnot(True)
+            ))
+            
+        # Profile specific filters only apply to users that have that profile
+        if search_name:
+            users_query = users_query.filter(db.or_(
+                Professional.professional_id.is_(None),
+                Professional.name.icontains(search_name, autoescape=True)
+            )).filter(db.or_(
+                Customer.customer_id.is_(None),
+                Customer.name.icontains(search_name, autoescape=True)
+            ))
+            
+        if search_service_type:
+            users_query = users_query.filter(db.or_(
+                Professional.professional_id.is_(None),
+                Professional.service_type == search_service_type
+            ))
+            
+        users_query = users_query.order_by(User.id)
+        
+        if page is not None or page_size is not None:
+            # Missing parameters take their defaults; 0 and negatives are rejected
+            page = 1 if page is None else page
+            page_size = 20 if page_size is None else page_size
+            if page < 1 or page_size < 1 or page_size > 100:
+                return {'message': 'page must be >= 1 and page_size between 1 and 100'}, 400
+            pagination = users_query.paginate(page=page, per_page=page_size, error_out=False)
+            rows = pagination.items
+        else:
+            pagination = None
+            rows = users_query.all()
+            
         result = []
-        
-        for user in users:
-            # Skip if doesn't match status filter
-            if search_status:
-                if search_status == 'active' and not user.active:
-                    continue
-                if search_status == 'blocked' and user.active:
-                    continue
-                    
+        for user, professional, customer in rows:
             user_data = {
                 'id': user.id,
                 'email': user.email,
@@ -786,128 +829,38 @@ class UserListResource(Resource):
                 'active': user.active
             }
             
-            include_user = True
-            
-            if user.role == 'professional':
-                professional = Professional.query.filter_by(user_id=user.id).first()
-                if professional:
-                    user_data['professional'] = {
-                        'id': professional.professional_id,
-                        'name': professional.name,
-                        'service_type': professional.service_type,
-                        'experience': professional.exp,
-                        'approved': professional.approved,
-                        'blocked': professional.blocked
-                    }
-                    
-                    # Apply professional specific filters
-                    if search_name and search_name.lower() not in professional.name.lower():
-                        include_user = False
-                    if search_service_type and search_service_type != professional.service_type:
-                        include_user = False
-                    if search_status == 'pending' and professional.approved:
-                        include_user = False
-                    
-            elif user.role == 'customer':
-                customer = Customer.query.filter_by(user_id=user.id).first()
-                if customer:
-                    user_data['customer'] = {
-                        'id': customer.customer_id,
-                        'name': customer.name,
-                        'address': customer.address,
-                        'pin': customer.pin,
-                        'blocked': customer.blocked
-                    }
+            if professional:
+                user_data['professional'] = {
+                    'id': professional.professional_id,
+                    'name': professional.name,
+                    'service_type': professional.service_type,
+                    'experience': professional.exp,
+                    'approved': professional.approved,
+                    'blocked': professional.blocked
+                }
                     
-                    # Apply customer specific filters
-                    if search_name and search_name.lower() not in customer.name.lower():
-                        include_user = False
+            elif customer:
+                user_data['customer'] = {
+                    'id': customer.customer_id,
+                    'name': customer.name,
+                    'address': customer.address,
+                    'pin': customer.pin,
+                    'blocked': customer.blocked
+                }
             
-            if include_user:
-                result.append(user_data)
+            result.append(user_data)
+            
+        if pagination:
+            return {
+                'total': pagination.total,
+                'pages': pagination.pages,
+                'current_page': pagination.page,
+                'users': result
+            }, 200
             
         return result, 200
 
 class ProfessionalApprovalResource(Resource):
-    @jwt_required()
-    def get(self, professional_id):
-        """Get detailed professional profile for admin review"""
-        user_id = get_jwt_identity()
-        user = User.query.get(int(user_id))
-        
-        if not user or user.role != 'admin':
-            return {'message': 'Admin access required'}, 403
-            
-        professional = Professional.query.get(professional_id)
-        if not professional:
-            return {'message': 'Professional not found'}, 404
-            
-        # Get user details
-        user_details = User.query.get(professional.user_id)
-        
-        # Get service requests data
-        service_requests = ServiceRequest.query.filter_by(professional_id=professional_id).all()
-        requests_data = []
-        
-        for req in service_requests:
-            service = Service.query.get(req.service_id)
-            customer = Customer.query.get(req.customer_id)
-            
-            req_data = {
-                'id': req.id,
-                'service_name': service.name if service else None,
-                'customer_name': customer.name if customer else None,
-                'status': req.status,
-                'date': req.req_date.strftime('%Y-%m-%d %H:%M:%S'),
-                'completed': req.comp_date.strftime('%Y-%m-%d %H:%M:%S') if req.comp_date else None
-            }
-            requests_data.append(req_data)
-            
-        # Get reviews data
-        reviews = []
-        for req in service_requests:
-            req_reviews = Review.query.filter_by(service_request_id=req.id).all()
-            for review in req_reviews:
-                customer = Customer.query.get(review.customer_id)
-                reviews.append({
-                    'id': review.id,
-                    'rating': review.rating,
-                    'comment': review.comment,
-                    'date': review.date_created.strftime('%Y-%m-%d %H:%M:%S'),
-                    'customer_name': customer.name if customer else None
-                })
-                
-        # Calculate average rating
-        avg_rating = 0
-        if reviews:
-            avg_rating = sum(r['rating'] for r in reviews) / len(reviews)
-        
-        result = {
-            'id': professional.professional_id,
-            'user_id': professional.user_id,
-            'email': user_details.email if user_details else None,
-            'name': professional.name,
-            'service_type': professional.service_type,
-            'experience': professional.exp,
-            'description': professional.description,
-            'pin': professional.pin,
-            'approved': professional.approved,
-            'blocked': professional.blocked,
-            'created_date': professional.created_date.strftime('%Y-%m-%d %H:%M:%S'),
-            'service_requests': {
-                'total': len(service_requests),
-                'completed': len([r for r in service_requests if r.status == 'closed']),
-                'recent': requests_data[:5]  # Show only 5 most recent requests
-            },
-            'reviews': {
-                'total': len(reviews),
-                'average_rating': round(avg_rating, 1),
-                'recent': reviews[:5]  # Show only 5 most recent reviews
-            }
-        }
-        
-        return result, 200
-            
     @jwt_required()
     def put(self, professional_id):
         user_id = get_jwt_identity()
@@ -944,8 +897,6 @@ class ProfessionalApprovalResource(Resource):
             
         try:
             db.session.commit()
-            # Invalidate relevant caches
-            invalidate_cache_prefix("admin:users")
             return {
                 'message': 'Professional status updated successfully',
                 'changes': changes,
@@ -959,83 +910,6 @@ class ProfessionalApprovalResource(Resource):
             return {'message': f'Something went wrong: {str(e)}'}, 500
 
 class CustomerBlockResource(Resource):
-    @jwt_required()
-    def get(self, customer_id):
-        """Get detailed customer profile for admin review"""
-        user_id = get_jwt_identity()
-        user = User.query.get(int(user_id))
-        
-        if not user or user.role != 'admin':
-            return {'message': 'Admin access required'}, 403
-            
-        customer = Customer.query.get(customer_id)
-        if not customer:
-            return {'message': 'Customer not found'}, 404
-            
-        # Get user details
-        user_details = User.query.get(customer.user_id)
-        
-        # Get service requests data
-        service_requests = ServiceRequest.query.filter_by(customer_id=customer_id).all()
-        requests_data = []
-        
-        for req in service_requests:
-            service = Service.query.get(req.service_id)
-            professional = Professional.query.get(req.professional_id) if req.professional_id else None
-            
-            req_data = {
-                'id': req.id,
-                'service_name': service.name if service else None,
-                'professional_name': professional.name if professional else None,
-                'status': req.status,
-                'date': req.req_date.strftime('%Y-%m-%d %H:%M:%S'),
-                'completed': req.comp_date.strftime('%Y-%m-%d %H:%M:%S') if req.comp_date else None
-            }
-            requests_data.append(req_data)
-            
-        # Get reviews written by customer
-        reviews = Review.query.filter_by(customer_id=customer_id).all()
-        reviews_data = []
-        
-        for review in reviews:
-            req = ServiceRequest.query.get(review.service_request_id)
-            service_name = 'Unknown Service'
-            if req:
-                service = Service.query.get(req.service_id) if req else None
-                if service:
-                    service_name = service.name
-                
-            reviews_data.append({
-                'id': review.id,
-                'rating': review.rating,
-                'comment': review.comment,
-                'date': review.date_created.strftime('%Y-%m-%d %H:%M:%S'),
-                'service': service_name
-            })
-            
-        result = {
-            'id': customer.customer_id,
-            'user_id': customer.user_id,
-            'email': user_details.email if user_details else None,
-            'name': customer.name,
-            'address': customer.address,
-            'pin': customer.pin,
-            'blocked': customer.blocked,
-            'created_date': customer.created_date.strftime('%Y-%m-%d %H:%M:%S'),
-            'service_requests': {
-                'total': len(service_requests),
-                'completed': len([r for r in service_requests if r.status == 'closed']),
-                'recent': requests_data[:5]  # Show only 5 most recent requests
-            },
-            'reviews': {
-                'total': len(reviews_data),
-                'average_given': round(sum(r['rating'] for r in reviews_data) / len(reviews_data), 1) if reviews_data else 0,
-                'recent': reviews_data[:5]  # Show only 5 most recent reviews
-            }
-        }
-        
-        return result, 200
-        
     @jwt_required()
     def put(self, customer_id):
         user_id = get_jwt_identity()
@@ -1067,8 +941,6 @@ class CustomerBlockResource(Resource):
             
         try:
             db.session.commit()
-            # Invalidate relevant caches
-            invalidate_cache_prefix("admin:users")
             return {
                 'message': 'Customer status updated successfully',
                 'changes': changes,
@@ -1084,40 +956,30 @@ class CustomerBlockResource(Resource):
 class ServiceTypeListResource(Resource):
     @cache_response(prefix="service_types", expire=1800)  # Cache for 30 minutes
     def get(self):
-        service_types = db.session.query(Service.service_type).distinct().all()
-        return [type[0] for type in service_types], 200
+        return service_catalog.snapshot().service_types, 200
 
 class PopularServicesResource(Resource):
     @cache_response(prefix="services:popular", expire=600)  # Cache for 10 minutes
+    @read_only
     def get(self):
         """
         Get popular services based on the number of service requests and ratings
+        
+        Query params:
+            limit: Number of services to return (default: 5)
+            service_type: Only rank services of this type
         """
+        limit = request.args.get('limit', 5, type=int)
+        service_type = request.args.get('service_type')
+        
+        if not limit or limit < 1:
+            return {'message': 'limit must be a positive integer'}, 400
+        
         try:
-            # Get all services
-            all_services = Service.query.all()
-            
-            # Calculate popularity based on request counts and review ratings
+            # Request counts and average ratings are aggregated per service in SQL
             popular_services = []
             
-            for service in all_services:
-                # Count service requests for this service
-                request_count = ServiceRequest.query.filter_by(service_id=service.id).count()
-                
-                # Calculate average rating from reviews for this service's requests
-                service_requests = ServiceRequest.query.filter_by(service_id=service.id).all()
-                
-                total_rating = 0
-                rating_count = 0
-                
-                for sr in service_requests:
-                    reviews = Review.query.filter_by(service_request_id=sr.id).all()
-                    for review in reviews:
-                        total_rating += review.rating
-                        rating_count += 1
-                
-                avg_rating = total_rating / rating_count if rating_count > 0 else 0
-                
+            for service, request_count, avg_rating, rating_count in load_popular_services(limit, service_type):
                 # Calculate popularity score (simple formula combining requests and ratings)
                 popularity_score = (request_count * 0.7) + (avg_rating * 0.3 * 10)  # Scale rating impact
                 
@@ -1133,9 +995,7 @@ class PopularServicesResource(Resource):
                     'popularity_score': round(popularity_score, 2)
                 })
             
-            # Sort by popularity score in descending order and take top 5
-            popular_services.sort(key=lambda x: x['popularity_score'], reverse=True)
-            return popular_services[:5], 200
+            return popular_services, 200
             
         except Exception as e:
             return {
@@ -1193,11 +1053,7 @@ class ServiceRequestActionResource(Resource):
                 # Add null check for service_id
                 service = None
                 if service_request.service_id:
-                    service = Service.query.get(service_request.service_id)
-                
-                # Invalidate caches
-                invalidate_cache_prefix("service_requests")
-                invalidate_cache_prefix(f"service_request:detail:{request_id}")
+                    service = service_catalog.get(service_request.service_id)
                 
                 return {
                     'message': 'Service request accepted successfully',
@@ -1239,10 +1095,6 @@ class ServiceRequestActionResource(Resource):
                 
                 db.session.commit()
                 
-                # Invalidate caches
-                invalidate_cache_prefix("service_requests")
-                invalidate_cache_prefix(f"service_request:detail:{request_id}")
-                
                 return {
                     'message': 'Service marked as complete. Waiting for customer confirmation.',
                     'request_id': request_id,
@@ -1342,7 +1194,7 @@ class NoAuthServiceRequestCreate(Resource):
         service_requests = ServiceRequest.query.all()
         result = []
         for req in service_requests:
-            service = Service.query.get(req.service_id)
+            service = service_catalog.get(req.service_id)
             customer = Customer.query.get(req.customer_id)
             
             req_data = {
@@ -1450,6 +1302,7 @@ class NoAuthProfessionalCreate(Resource):
 
 class ServiceRequestStatsResource(Resource):
     @jwt_required()
+    @read_only
     def get(self):
         user_id = get_jwt_identity()
         user = User.query.get(int(user_id))
@@ -1457,41 +1310,23 @@ class ServiceRequestStatsResource(Resource):
         if not user:
             return {'message': 'User not found'}, 404
             
+        # Optional per-day breakdown for dashboard sparklines
+        days = request.args.get('days', type=int)
+        if days is not None and (days < 1 or days > 365):
+            return {'message': 'days must be between 1 and 365'}, 400
+            
         if user.role == 'admin':
             # Admin can see all stats
-            total_requests = ServiceRequest.query.count()
-            pending_requests = ServiceRequest.query.filter_by(status='requested').count()
-            assigned_requests = ServiceRequest.query.filter_by(status='assigned').count()
-            completed_requests = ServiceRequest.query.filter_by(status='closed').count()
-            
-            # Get recent activity
-            recent_requests = ServiceRequest.query.order_by(ServiceRequest.req_date.desc()).limit(5).all()
-            recent_activity = []
-            for req in recent_requests:
-                # Add null check for service_id
-                service_name = 'Unknown Service'
-                if req.service_id:
-                    service = Service.query.get(req.service_id)
-                    if service:
-                        service_name = service.name
-                
-                customer = Customer.query.get(req.customer_id)
-                activity = {
-                    'id': req.id,
-                    'service': service_name,
-                    'customer': customer.name if customer else 'Unknown Customer',
-                    'status': req.status,
-                    'date': req.req_date.strftime('%Y-%m-%d %H:%M:%S')
-                }
-                recent_activity.append(activity)
-            
-            return {
-                'total_requests': total_requests,
-                'pending_requests': pending_requests,
-                'assigned_requests': assigned_requests,
-                'completed_requests': completed_requests,
-                'recent_activity': recent_activity
-            }, 200
+            requests_query = ServiceRequest.query
+            counts = load_status_counts(requests_query, ['requested', 'assigned', 'closed'])
+            
+            result = {
+                'total_requests': counts['total'],
+                'pending_requests': counts['requested'],
+                'assigned_requests': counts['assigned'],
+                'completed_requests': counts['closed'],
+                'recent_activity': self.recent_activity(requests_query)
+            }
             
         elif user.role == 'professional':
             # Professional can see their own stats
@@ -1499,49 +1334,37 @@ class ServiceRequestStatsResource(Resource):
             if not professional:
                 return {'message': 'Professional profile not found'}, 404
                 
-            total_requests = ServiceRequest.query.filter_by(professional_id=professional.professional_id).count()
-            pending_requests = ServiceRequest.query.filter_by(
-                professional_id=professional.professional_id,
-                status='assigned'
-            ).count()
-            completed_requests = ServiceRequest.query.filter_by(
-                professional_id=professional.professional_id,
-                status='closed'
-            ).count()
-            
-            # Get recent activity
-            recent_requests = ServiceRequest.query.filter_by(
-                professional_id=professional.professional_id
-            ).order_by(ServiceRequest.req_date.desc()).limit(5).all()
-            
-            recent_activity = []
-            for req in recent_requests:
-                # Add null check for service_id
-                service_name = 'Unknown Service'
-                if req.service_id:
-                    service = Service.query.get(req.service_id)
-                    if service:
-                        service_name = service.name
-                
-                customer = Customer.query.get(req.customer_id)
-                activity = {
-                    'id': req.id,
-                    'service': service_name,
-                    'customer': customer.name if customer else 'Unknown Customer',
-                    'status': req.status,
-                    'date': req.req_date.strftime('%Y-%m-%d %H:%M:%S')
-                }
-                recent_activity.append(activity)
+            requests_query = ServiceRequest.query.filter_by(professional_id=professional.professional_id)
+            counts = load_status_counts(requests_query, ['assigned', 'closed'])
             
-            return {
-                'total_requests': total_requests,
-                'pending_requests': pending_requests,
-                'completed_requests': completed_requests,
-                'recent_activity': recent_activity
-            }, 200
+            result = {
+                'total_requests': counts['total'],
+                'pending_requests': counts['assigned'],
+                'completed_requests': counts['closed'],
+                'recent_activity': self.recent_activity(requests_query)
+            }
             
         else:
             return {'message': 'Unauthorized access'}, 403
+            
+        if days:
+            result['daily'] = load_daily_counts(requests_query, days)
+            
+        return result, 200
+    
+    @staticmethod
+    def recent_activity(requests_query):
+        """Five most recent requests with service and customer names, in one query"""
+        recent_activity = []
+        for req, service_name, customer_name in load_recent_activity(requests_query):
+            recent_activity.append({
+                'id': req.id,
+                'service': service_name or 'Unknown Service',
+                'customer': customer_name or 'Unknown Customer',
+                'status': req.status,
+                'date': req.req_date.strftime('%Y-%m-%d %H:%M:%S')
+            })
+        return recent_activity
 
 class ServiceRequestScheduleResource(Resource):
     @jwt_required()
@@ -1573,12 +1396,12 @@ class ServiceRequestScheduleResource(Resource):
         requests = ServiceRequest.query.filter(
             ServiceRequest.professional_id == professional.professional_id,
             ServiceRequest.status == 'assigned',
-            db.func.date(ServiceRequest.req_date) == target_date
+            date_of(ServiceRequest.req_date) == target_date
         ).all()
         
         schedule = []
         for req in requests:
-            service = Service.query.get(req.service_id)
+            service = service_catalog.get(req.service_id)
             customer = Customer.query.get(req.customer_id)
             schedule.append({
                 'id': req.id,
@@ -1697,7 +1520,7 @@ class ProfessionalReviewsResource(Resource):
         for review in reviews.items:
             customer = Customer.query.get(review.customer_id)
             service_request = ServiceRequest.query.get(review.service_request_id)
-            service = Service.query.get(service_request.service_id) if service_request else None
+            service = service_catalog.get(service_request.service_id) if service_request else None
             
             result.append({
                 'id': review.id,
@@ -1717,7 +1540,8 @@ class ProfessionalReviewsResource(Resource):
 
 class AdminProfessionalsListResource(Resource):
     @jwt_required()
-    @cache_response(prefix="admin:professionals", expire=300)  # Cache for 5 minutes
+    @cache_response(prefix="admin:professionals", expire=300, vary_on="role")  # Cache for 5 minutes, per role
+    @read_only
     def get(self, professional_id=None):
         user_id = get_jwt_identity()
         user = User.query.get(int(user_id))
@@ -1727,40 +1551,40 @@ class AdminProfessionalsListResource(Resource):
         
         # If professional_id is provided, return details for a single professional
         if professional_id:
-            professional = Professional.query.get(professional_id)
-            if not professional:
+            row = db.session.query(Professional, User).outerjoin(
+                User, Professional.user_id == User.id
+            ).filter(Professional.professional_id == professional_id).first()
+            if not row:
                 return {'message': 'Professional not found'}, 404
-                
-            # Get the user info
-            pro_user = User.query.get(professional.user_id)
+            professional, pro_user = row
             if not pro_user:
                 return {'message': 'User not found'}, 404
-                
-            # Get service requests count
-            total_requests = ServiceRequest.query.filter_by(professional_id=professional.professional_id).count()
-            completed_requests = ServiceRequest.query.filter_by(
-                professional_id=professional.professional_id,
-                status='closed'
-            ).count()
-            
-            # Get reviews and calculate average rating
-            reviews = Review.query.join(ServiceRequest).filter(
-                ServiceRequest.professional_id == professional.professional_id
-            ).all()
-            
-            avg_rating = 0
-            if reviews:
-                avg_rating = sum(review.rating for review in reviews) / len(reviews)
-                
-            # Get recent service requests
-            recent_requests = ServiceRequest.query.filter_by(
-                professional_id=professional.professional_id
-            ).order_by(ServiceRequest.req_date.desc()).limit(5).all()
+            
+            # Recent requests are paginated; the default is the five most recent
+            page = request.args.get('page', 1, type=int)
+            page_size = request.args.get('page_size', 5, type=int)
+            paginate = 'page' in request.args or 'page_size' in request.args
+            if page < 1 or page_size < 1 or page_size > 100:
+                return {'message': 'page must be >= 1 and page_size between 1 and 100'}, 400
+                
+            # Totals are aggregated in SQL rather than by loading every request and review
+            requests_query = ServiceRequest.query.filter_by(professional_id=professional.professional_id)
+            request_counts = load_status_counts(requests_query, ['closed'])
+            reviews_query = Review.query.join(
+                ServiceRequest, Review.service_request_id == ServiceRequest.id
+            ).filter(ServiceRequest.professional_id == professional.professional_id)
+            _, avg_rating = load_rating_summary(reviews_query)
+                
+            # Load one page of recent requests, then their customers in a batched IN query
+            recent_requests = requests_query.order_by(
+                ServiceRequest.req_date.desc(), ServiceRequest.id.desc()
+            ).offset((page - 1) * page_size).limit(page_size).all()
+            customers = load_by_ids(Customer, [req.customer_id for req in recent_requests])
             
             recent_requests_data = []
             for req in recent_requests:
-                service = Service.query.get(req.service_id)
-                customer = Customer.query.get(req.customer_id)
+                service = service_catalog.get(req.service_id)
+                customer = customers.get(req.customer_id)
                 recent_requests_data.append({
                     'id': req.id,
                     'service': service.name if service else 'Unknown Service',
@@ -1769,7 +1593,7 @@ class AdminProfessionalsListResource(Resource):
                     'status': req.status
                 })
                 
-            return {
+            result = {
                 'id': professional.professional_id,
                 'user_id': professional.user_id,
                 'name': professional.name,
@@ -1784,60 +1608,67 @@ class AdminProfessionalsListResource(Resource):
                 'active': pro_user.active,
                 'created_date': professional.created_date.strftime('%Y-%m-%d'),
                 'stats': {
-                    'total_requests': total_requests,
-                    'completed_requests': completed_requests,
-                    'average_rating': round(avg_rating, 1)
+                    'total_requests': request_counts['total'],
+                    'completed_requests': request_counts['closed'],
+                    'average_rating': round(avg_rating or 0, 1)
                 },
                 'recent_requests': recent_requests_data
-            }, 200
+            }
+            if paginate:
+                result['page'] = page
+                result['pages'] = (request_counts['total'] + page_size - 1) // page_size
+            return result, 200
         
         # Otherwise, return list of all professionals
         # Get search parameters
         search_name = request.args.get('name')
         search_service_type = request.args.get('service_type')
         search_status = request.args.get('status')  # approved, pending, blocked
+        sort = request.args.get('sort', 'created_date')  # created_date, rating, completed
+        page = request.args.get('page', type=int)
+        page_size = request.args.get('page_size', type=int)
         
-        # Get all professionals
-        professionals_list = Professional.query.all()
-        result = []
+        # Professionals with their users and request/review stats in one statement
+        query = professional_stats_query()
         
-        for professional in professionals_list:
-            # Get the user info
-            pro_user = User.query.get(professional.user_id)
-            if not pro_user:
-                continue
-                
-            # Apply filters
-            if search_name and search_name.lower() not in professional.name.lower():
-                continue
-                
-            if search_service_type and search_service_type != professional.service_type:
-                continue
-                
-            if search_status:
-                if search_status == 'approved' and not professional.approved:
-                    continue
-                if search_status == 'pending' and professional.approved:
-                    continue
-                if search_status == 'blocked' and not professional.blocked:
-                    continue
-            
-            # Get service requests count
-            total_requests = ServiceRequest.query.filter_by(professional_id=professional.professional_id).count()
-            completed_requests = ServiceRequest.query.filter_by(
-                professional_id=professional.professional_id,
-                status='closed'
-            ).count()
-            
-            # Get reviews and calculate average rating
-            reviews = Review.query.join(ServiceRequest).filter(
-                ServiceRequest.professional_id == professional.professional_id
-            ).all()
-            
-            avg_rating = 0
-            if reviews:
-                avg_rating = sum(review.rating for review in reviews) / len(reviews)
-                
+        # Apply filters
+        if search_name:
+            query = query.filter(Professional.name.icontains(search_name, autoescape=True))
+            
+        if search_service_type:
+            query = query.filter(Professional.service_type == search_service_type)
+            
+        if search_status == 'approved':
+            query = query.filter(Professional.approved.is_(True))
+        elif search_status == 'pending':
+            query = query.filter(Professional.approved.isnot(True))
+        elif search_status == 'blocked':
+            query = query.filter(Professional.blocked.is_(True))
+            
+        # Sort in SQL, newest first by default; ties keep professional id order
+        sort_columns = {
+            'created_date': date_of(Professional.created_date).desc(),
+            'rating': db.desc('average_rating'),
+            'completed': db.desc('completed_requests')
+        }
+        if sort not in sort_columns:
+            return {'message': f"Invalid sort. Use one of: {', '.join(sort_columns)}"}, 400
+        query = query.order_by(sort_columns[sort], Professional.professional_id)
+        
+        if page is not None or page_size is not None:
+            # Missing parameters take their defaults; 0 and negatives are rejected
+            page = 1 if page is None else page
+            page_size = 20 if page_size is None else page_size
+            if page < 1 or page_size < 1 or page_size > 100:
+                return {'message': 'page must be >= 1 and page_size between 1 and 100'}, 400
+            pagination = query.paginate(page=page, per_page=page_size, error_out=False)
+            rows = pagination.items
+        else:
+            pagination = None
+            rows = query.all()
+            
+        result = []
+        for professional, pro_user, total_requests, completed_requests, avg_rating in rows:
             result.append({
                 'id': professional.professional_id,
                 'user_id': professional.user_id,
@@ -1859,8 +1690,13 @@ class AdminProfessionalsListResource(Resource):
                 }
             })
             
-        # Sort by creation date (newest first)
-        result.sort(key=lambda x: x['created_date'], reverse=True)
+        if pagination:
+            return {
+                'total': pagination.total,
+                'pages': pagination.pages,
+                'current_page': pagination.page,
+                'professionals': result
+            }, 200
         
         return {
             'total': len(result),
@@ -1869,7 +1705,8 @@ class AdminProfessionalsListResource(Resource):
     
 class AdminCustomersListResource(Resource):
     @jwt_required()
-    @cache_response(prefix="admin:customers", expire=300)  # Cache for 5 minutes
+    @cache_response(prefix="admin:customers", expire=300, vary_on="role")  # Cache for 5 minutes, per role
+    @read_only
     def get(self, customer_id=None):
         user_id = get_jwt_identity()
         user = User.query.get(int(user_id))
@@ -1879,38 +1716,37 @@ class AdminCustomersListResource(Resource):
             
         # If customer_id is provided, return details for a single customer
         if customer_id:
-            customer = Customer.query.get(customer_id)
-            if not customer:
+            row = db.session.query(Customer, User).outerjoin(
+                User, Customer.user_id == User.id
+            ).filter(Customer.customer_id == customer_id).first()
+            if not row:
                 return {'message': 'Customer not found'}, 404
-                
-            # Get the user info
-            cust_user = User.query.get(customer.user_id)
+            customer, cust_user = row
             if not cust_user:
                 return {'message': 'User not found'}, 404
+            
+            # Recent requests are paginated; the default is the five most recent
+            page = request.args.get('page', 1, type=int)
+            page_size = request.args.get('page_size', 5, type=int)
+            paginate = 'page' in request.args or 'page_size' in request.args
+            if page < 1 or page_size < 1 or page_size > 100:
+                return {'message': 'page must be >= 1 and page_size between 1 and 100'}, 400
                 
-            # Get service requests count
-            total_requests = ServiceRequest.query.filter_by(customer_id=customer.customer_id).count()
-            completed_requests = ServiceRequest.query.filter_by(
-                customer_id=customer.customer_id,
-                status='closed'
-            ).count()
-            
-            # Get reviews count and average rating given
-            reviews = Review.query.filter_by(customer_id=customer.customer_id).all()
-            reviews_count = len(reviews)
-            avg_rating_given = 0
-            if reviews:
-                avg_rating_given = sum(review.rating for review in reviews) / len(reviews)
+            # Totals are aggregated in SQL rather than by loading every request and review
+            requests_query = ServiceRequest.query.filter_by(customer_id=customer.customer_id)
+            request_counts = load_status_counts(requests_query, ['closed'])
+            reviews_count, avg_rating_given = load_rating_summary(Review.query.filter_by(customer_id=customer.customer_id))
                 
-            # Get recent service requests
-            recent_requests = ServiceRequest.query.filter_by(
-                customer_id=customer.customer_id
-            ).order_by(ServiceRequest.req_date.desc()).limit(5).all()
+            # Load one page of recent requests, then their professionals in a batched IN query
+            recent_requests = requests_query.order_by(
+                ServiceRequest.req_date.desc(), ServiceRequest.id.desc()
+            ).offset((page - 1) * page_size).limit(page_size).all()
+            professionals = load_by_ids(Professional, [req.professional_id for req in recent_requests])
             
             recent_requests_data = []
             for req in recent_requests:
-                service = Service.query.get(req.service_id)
-                professional = Professional.query.get(req.professional_id) if req.professional_id else None
+                service = service_catalog.get(req.service_id)
+                professional = professionals.get(req.professional_id)
                 recent_requests_data.append({
                     'id': req.id,
                     'service': service.name if service else 'Unknown Service',
@@ -1919,7 +1755,7 @@ class AdminCustomersListResource(Resource):
                     'status': req.status
                 })
                 
-            return {
+            result = {
                 'id': customer.customer_id,
                 'user_id': customer.user_id,
                 'name': customer.name,
@@ -1930,53 +1766,71 @@ class AdminCustomersListResource(Resource):
                 'active': cust_user.active,
                 'created_date': customer.created_date.strftime('%Y-%m-%d'),
                 'stats': {
-                    'total_requests': total_requests,
-                    'completed_requests': completed_requests,
+                    'total_requests': request_counts['total'],
+                    'completed_requests': request_counts['closed'],
                     'reviews_count': reviews_count,
-                    'average_rating_given': round(avg_rating_given, 1)
+                    'average_rating_given': round(avg_rating_given or 0, 1)
                 },
                 'recent_requests': recent_requests_data
-            }, 200
+            }
+            if paginate:
+                result['page'] = page
+                result['pages'] = (request_counts['total'] + page_size - 1) // page_size
+            return result, 200
         
         # Otherwise, return list of all customers
         # Get search parameters
         search_name = request.args.get('name')
         search_pin = request.args.get('pin')
         search_status = request.args.get('status')  # active, blocked
+        sort = request.args.get('sort', 'created_date')  # created_date, requests, completed, reviews
+        page = request.args.get('page', type=int)
+        page_size = request.args.get('page_size', type=int)
         
-        # Get all customers
-        customers_list = Customer.query.all()
-        result = []
+        # Customers with their users and request/review counts in one statement
+        query = customer_stats_query()
         
-        for customer in customers_list:
-            # Get the user info
-            cust_user = User.query.get(customer.user_id)
-            if not cust_user:
-                continue
-                
-            # Apply filters
-            if search_name and search_name.lower() not in customer.name.lower():
-                continue
-                
-            if search_pin and str(search_pin) != str(customer.pin):
-                continue
-                
-            if search_status:
-                if search_status == 'active' and customer.blocked:
-                    continue
-                if search_status == 'blocked' and not customer.blocked:
-                    continue
-            
-            # Get service requests count
-            total_requests = ServiceRequest.query.filter_by(customer_id=customer.customer_id).count()
-            completed_requests = ServiceRequest.query.filter_by(
-                customer_id=customer.customer_id,
-                status='closed'
-            ).count()
-            
-            # Get reviews count
-            reviews_count = Review.query.filter_by(customer_id=customer.customer_id).count()
-                
+        # Apply filters
+        if search_name:
+            query = query.filter(Customer.name.icontains(search_name, autoescape=True))
+            
+        if search_pin:
+            # Pins are stored as integers; anything else cannot match
+            if search_pin.isdigit() and str(int(search_pin)) == search_pin:
+                query = query.filter(Customer.pin == int(search_pin))
+            else:
+                query = query.filter(db.false())
+                
+        if search_status == 'active':
+            query = query.filter(Customer.blocked.isnot(True))
+        elif search_status == 'blocked':
+            query = query.filter(Customer.blocked.is_(True))
+            
+        # Sort in SQL, newest first by default; ties keep customer id order
+        sort_columns = {
+            'created_date': date_of(Customer.created_date).desc(),
+            'requests': db.desc('total_requests'),
+            'completed': db.desc('completed_requests'),
+            'reviews': db.desc('reviews_count')
+        }
+        if sort not in sort_columns:
+            return {'message': f"Invalid sort. Use one of: {', '.join(sort_columns)}"}, 400
+        query = query.order_by(sort_columns[sort], Customer.customer_id)
+        
+        if page is not None or page_size is not None:
+            # Missing parameters take their defaults; 0 and negatives are rejected
+            page = 1 if page is None else page
+            page_size = 20 if page_size is None else page_size
+            if page < 1 or page_size < 1 or page_size > 100:
+                return {'message': 'page must be >= 1 and page_size between 1 and 100'}, 400
+            pagination = query.paginate(page=page, per_page=page_size, error_out=False)
+            rows = pagination.items
+        else:
+            pagination = None
+            rows = query.all()
+            
+        result = []
+        for customer, cust_user, total_requests, completed_requests, reviews_count in rows:
             result.append({
                 'id': customer.customer_id,
                 'user_id': customer.user_id,
@@ -1994,8 +1848,13 @@ class AdminCustomersListResource(Resource):
                 }
             })
             
-        # Sort by creation date (newest first)
-        result.sort(key=lambda x: x['created_date'], reverse=True)
+        if pagination:
+            return {
+                'total': pagination.total,
+                'pages': pagination.pages,
+                'current_page': pagination.page,
+                'customers': result
+            }, 200
         
         return {
             'total': len(result),
@@ -2031,8 +1890,6 @@ class AdminProfessionalBlockResource(Resource):
             
         try:
             db.session.commit()
-            # Invalidate cache
-            invalidate_cache_prefix("admin:professionals")
             return {'message': message}, 200
         except Exception as e:
             db.session.rollback()
@@ -2067,8 +1924,6 @@ class AdminCustomerBlockResource(Resource):
             
         try:
             db.session.commit()
-            # Invalidate cache
-            invalidate_cache_prefix("admin:customers")
             return {'message': message}, 200
         except Exception as e:
             db.session.rollback()
@@ -33,7 +33,7 @@ def cache_stats():
         }), 403
     
     stats = get_cache_stats()
-    if stats:
+    if stats['active_cache'] == 'redis':
         return jsonify({
             'status': 'Redis cache is active',
             'stats': stats
@@ -41,28 +41,26 @@ def cache_stats():
     else:
         return jsonify({
             'status': 'Redis cache is not available',
-            'stats': None
+            'stats': stats
         })
 
 @api_bp.route('/cache-stats-public')
 def cache_stats_public():
     """Public cache stats without authentication requirement"""
     try:
-        stats = get_cache_stats() or {}
+        stats = get_cache_stats(include_metrics=False) or {}
         
         # Get values with safer defaults
         redis_info = stats.get('redis', {})
         memory_info = stats.get('memory_cache', {})
+        metrics = stats.get('metrics', {})
         
         return jsonify({
             'status': 'ok',
             'active_cache': stats.get('active_cache', 'memory'),
-            'memory_cache_keys': memory_info.get('total_keys', 0),
-            'redis_available': (
-                'redis' in stats and 
-                not redis_info.get('error') and 
-                redis_info.get('available', False) is not False
-            ),
+            'memory_cache_keys': memory_info.get('size', 0),
+            'redis_available': redis_info.get('connected', False) and not redis_info.get('error'),
+            'hit_ratio': metrics.get('totals', {}).get('hit_ratio'),
         })
     except Exception as e:
         # Return a graceful error response instead of 500
@@ -101,6 +99,7 @@ api.add_resource(ProfessionalProfileResource, '/professional/profile')
 api.add_resource(UserListResource, '/admin/users')
 api.add_resource(AdminProfessionalsListResource, '/admin/professionals', '/admin/professionals/<int:professional_id>')
 api.add_resource(AdminCustomersListResource, '/admin/customers', '/admin/customers/<int:customer_id>')
+# Detail GETs are served by the list resources above; these handle PUT on the same URLs
 api.add_resource(ProfessionalApprovalResource, '/admin/professionals/<int:professional_id>')
 api.add_resource(CustomerBlockResource, '/admin/customers/<int:customer_id>')
 api.add_resource(AdminProfessionalBlockResource, '/admin/professionals/<int:professional_id>/block', '/admin/professionals/<int:professional_id>/unblock')
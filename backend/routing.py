@@ -0,0 +1,174 @@
+import functools
+import logging
+import time
+from flask import g, current_app, has_app_context
+from flask_jwt_extended import get_jwt_identity
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event, make_url
+from sqlalchemy.sql import Select
+
+logger = logging.getLogger(__name__)
+
+# Bind key of the read engine in SQLALCHEMY_BINDS
+READ_BIND = 'read'
+
+# Redis keys sharing a client's pin to the primary with the other workers
+PIN_KEY_PREFIX = 'read:pin:'
+
+# Clients tracked in _recent_writes before expired pins are pruned
+MAX_PINNED_CLIENTS = 10000
+
+# JWT identity -> time of the client's last write in this worker
+_recent_writes = {}
+
+def read_database_url(app):
+    """
+    URL of the read engine: READ_DATABASE_URL (e.g. a replica) if set, otherwise
+    a read-only connection to the primary SQLite file, or None for other
+    primaries without a replica.
+    """
+    if app.config.get('READ_DATABASE_URL'):
+        return app.config['READ_DATABASE_URL']
+
+    url = make_url(app.config['SQLALCHEMY_DATABASE_URI'])
+    if url.get_backend_name() != 'sqlite' or url.database in (None, '', ':memory:') or url.query.get('uri'):
+        return None
+    return f"sqlite:///file:{url.database}?mode=ro&uri=true"
+
+def configure_read_engine(app):
+    """
+    Add the read engine to the app's SQLALCHEMY_BINDS.
+
+    Must be called before db.init_app(app), which creates the engines. Nothing
+    is added when READ_ROUTING is off or there is no read engine to use, in
+    which case every query goes to the primary.
+
+    Args:
+        app: Flask application to configure
+    """
+    if not app.config.get('READ_ROUTING', True):
+        return
+    url = read_database_url(app)
+    if url:
+        app.config['SQLALCHEMY_BINDS'] = {**app.config.get('SQLALCHEMY_BINDS', {}), READ_BIND: url}
+        logger.info(f"Read-only resources use the read engine {make_url(url).render_as_string(hide_password=True)}")
+
+def read_only(func):
+    """
+    Send the SELECT queries of a resource method to the read engine.
+
+    Queries go back to the primary once the request has written anything (see
+    use_primary). When the read engine is a replica that may lag (see
+    replica_lags), a client that wrote is also pinned to the primary for
+    READ_PRIMARY_WINDOW seconds so it reads its own writes.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        previous = g.get('read_only', False)
+        g.read_only = True
+        try:
+            return func(*args, **kwargs)
+        finally:
+            g.read_only = previous
+    return wrapper
+
+def use_primary():
+    """Send every remaining query of the current request to the primary"""
+    g.use_primary = True
+
+def replica_lags():
+    """
+    True if the read engine is a replica set with READ_DATABASE_URL, which may
+    lag behind the primary. The default read-only connection to the SQLite
+    file reads the primary's own database and never lags.
+    """
+    return bool(current_app.config.get('READ_DATABASE_URL'))
+
+def _client_identity():
+    try:
+        return get_jwt_identity()
+    except RuntimeError:
+        # No JWT was verified for this request
+        return None
+
+def pin_client():
+    """Pin the current client to the primary for READ_PRIMARY_WINDOW seconds"""
+    identity = _client_identity()
+    window = current_app.config.get('READ_PRIMARY_WINDOW', 0)
+    if identity is None or window <= 0 or g.get('client_pinned_until', 0) > time.time():
+        return
+
+    now = time.time()
+    if len(_recent_writes) >= MAX_PINNED_CLIENTS:
+        for client, written in list(_recent_writes.items()):
+            if now - written >= window:
+                _recent_writes.pop(client, None)
+    _recent_writes[str(identity)] = now
+    g.client_pinned_until = now + window
+
+    # The client's next request may be served by another worker.
+    # Imported here: importing the models must not set up the cache and its Redis pools
+    from backend.cache import redis_client, redis_available
+    if redis_available():
+        try:
+            redis_client.set(PIN_KEY_PREFIX + str(identity), 1, px=int(window * 1000))
+        except Exception as e:
+            logger.warning(f"Could not share the primary pin of client {identity}: {e}")
+
+def client_pinned():
+    """True if the current client wrote within the last READ_PRIMARY_WINDOW seconds"""
+    identity = _client_identity()
+    if identity is None:
+        return False
+
+    written = _recent_writes.get(str(identity))
+    if written is not None and time.time() - written < current_app.config.get('READ_PRIMARY_WINDOW', 0):
+        return True
+
+    from backend.cache import redis_client, redis_available
+    if redis_available():
+        try:
+            return bool(redis_client.exists(PIN_KEY_PREFIX + str(identity)))
+        except Exception as e:
+            logger.warning(f"Could not check the primary pin of client {identity}: {e}")
+    return False
+
+def reads_routed():
+    """True if SELECT queries of the current request may use the read engine"""
+    if not has_app_context() or not g.get('read_only', False) or g.get('use_primary', False):
+        return False
+    if not replica_lags():
+        return True
+    # Checked once per request: it may cost a Redis round trip
+    if 'client_pinned' not in g:
+        g.client_pinned = client_pinned()
+    return not g.client_pinned
+
+def read_from_replica():
+    """True if the current request has read from a replica that may lag"""
+    return has_app_context() and g.get('replica_read', False)
+
+class RoutingSession(Session):
+    """
+    Session sending SELECT queries to the read engine inside read_only methods.
+
+    Everything else (flushes, other statements, and any query while the session
+    has pending changes) uses the bind Flask-SQLAlchemy would choose.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and isinstance(clause, Select) and reads_routed() and not self._flushing:
+            engine = self._db.engines.get(READ_BIND)
+            if engine is not None and not (self.new or self.deleted or self.identity_map.check_modified()):
+                if replica_lags():
+                    g.replica_read = True
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+@event.listens_for(RoutingSession, 'after_flush')
+def _pin_to_primary(session, flush_context):
+    # Rows written by this request are only guaranteed to be on the primary
+    if has_app_context():
+        use_primary()
+        if replica_lags():
+            pin_client()
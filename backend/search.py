@@ -0,0 +1,138 @@
+import logging
+from flask import current_app
+from sqlalchemy import text
+from backend.model import db, Customer, Service, ServiceRequest
+
+logger = logging.getLogger(__name__)
+
+# FTS5 table indexing the searchable text of each service request (rowid = service_request.id).
+# The trigram tokenizer keeps the case-insensitive substring semantics of the old Python filter.
+FTS_TABLE = 'service_request_fts'
+
+# Shortest term the trigram tokenizer can match; shorter terms fall back to LIKE
+MIN_FTS_TERM_LENGTH = 3
+
+CREATE_FTS_TABLE = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE}
+USING fts5(service_name, customer_name, remarks, tokenize='trigram')
+"""
+
+INSERT_FTS_ROW = f"""
+INSERT INTO {FTS_TABLE}(rowid, service_name, customer_name, remarks)
+SELECT new.id,
+       (SELECT name FROM service WHERE id = new.service_id),
+       (SELECT name FROM customer WHERE customer_id = new.customer_id),
+       new.remarks;
+"""
+
+# Triggers keeping the index in sync with service requests and the names they denormalize
+TRIGGERS = {
+    'service_request_fts_insert': f"""
+        CREATE TRIGGER IF NOT EXISTS service_request_fts_insert
+        AFTER INSERT ON service_request BEGIN
+            {INSERT_FTS_ROW}
+        END
+    """,
+    'service_request_fts_update': f"""
+        CREATE TRIGGER IF NOT EXISTS service_request_fts_update
+        AFTER UPDATE OF service_id, customer_id, remarks ON service_request BEGIN
+            DELETE FROM {FTS_TABLE} WHERE rowid = old.id;
+            {INSERT_FTS_ROW}
+        END
+    """,
+    'service_request_fts_delete': f"""
+        CREATE TRIGGER IF NOT EXISTS service_request_fts_delete
+        AFTER DELETE ON service_request BEGIN
+            DELETE FROM {FTS_TABLE} WHERE rowid = old.id;
+        END
+    """,
+    'service_fts_rename': f"""
+        CREATE TRIGGER IF NOT EXISTS service_fts_rename
+        AFTER UPDATE OF name ON service BEGIN
+            UPDATE {FTS_TABLE} SET service_name = new.name
+            WHERE rowid IN (SELECT id FROM service_request WHERE service_id = new.id);
+        END
+    """,
+    'customer_fts_rename': f"""
+        CREATE TRIGGER IF NOT EXISTS customer_fts_rename
+        AFTER UPDATE OF name ON customer BEGIN
+            UPDATE {FTS_TABLE} SET customer_name = new.name
+            WHERE rowid IN (SELECT id FROM service_request WHERE customer_id = new.customer_id);
+        END
+    """,
+}
+
+REBUILD_FTS_INDEX = f"""
+INSERT INTO {FTS_TABLE}(rowid, service_name, customer_name, remarks)
+SELECT service_request.id, service.name, customer.name, service_request.remarks
+FROM service_request
+LEFT OUTER JOIN service ON service.id = service_request.service_id
+LEFT OUTER JOIN customer ON customer.customer_id = service_request.customer_id
+"""
+
+def ensure_search_index(app):
+    """
+    Create the service request FTS5 index and its sync triggers if needed.
+
+    The index is rebuilt whenever any trigger is missing, which covers a fresh
+    database as well as tables recreated by database.py. Must be called inside
+    an application context after the tables exist.
+
+    Args:
+        app: Flask application whose availability flag is recorded in app.extensions
+
+    Returns:
+        bool: True if full-text search is available
+    """
+    available = False
+    if app.config.get('FULL_TEXT_SEARCH', True) and db.engine.dialect.name == 'sqlite':
+        try:
+            with db.engine.begin() as conn:
+                existing = {row[0] for row in conn.execute(
+                    text("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+                )}
+                conn.execute(text(CREATE_FTS_TABLE))
+
+                if not set(TRIGGERS).issubset(existing):
+                    for name, ddl in TRIGGERS.items():
+                        conn.execute(text(f"DROP TRIGGER IF EXISTS {name}"))
+                        conn.execute(text(ddl))
+                    conn.execute(text(f"DELETE FROM {FTS_TABLE}"))
+                    conn.execute(text(REBUILD_FTS_INDEX))
+                    logger.info("Service request search index rebuilt")
+            available = True
+        except Exception as e:
+            logger.warning(f"Full-text search unavailable, falling back to LIKE: {e}")
+
+    app.extensions['search_index'] = available
+    return available
+
+def search_index_available(app):
+    """Return True if ensure_search_index enabled FTS5 for this app"""
+    return app.extensions.get('search_index', False)
+
+def use_search_index(term):
+    """Return True if the term should be matched through the FTS5 index"""
+    return search_index_available(current_app) and len(term) >= MIN_FTS_TERM_LENGTH
+
+def fts_query(term):
+    """Quote a user-supplied term as a single FTS5 phrase"""
+    return '"' + term.replace('"', '""') + '"'
+
+def search_rank_subquery(term):
+    """
+    Subquery of (rowid, rank) for service requests matching the search term,
+    where a lower rank is a better match (FTS5 bm25).
+    """
+    fts = db.table(FTS_TABLE, db.column('rowid'), db.column('rank'))
+    return db.select(
+        fts.c.rowid.label('request_id'), fts.c.rank.label('rank')
+    ).where(db.literal_column(FTS_TABLE).op('MATCH')(fts_query(term))).subquery()
+
+def like_search_filter(term):
+    """LIKE-based equivalent of the FTS5 search, for short terms and other databases"""
+    return db.or_(
+        Service.name.icontains(term, autoescape=True),
+        Customer.name.icontains(term, autoescape=True),
+        ServiceRequest.remarks.icontains(term, autoescape=True)
+    )
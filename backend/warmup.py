@@ -0,0 +1,63 @@
+import logging
+import os
+import time
+from backend.resources import ServiceListResource, ServiceTypeListResource, PopularServicesResource
+
+logger = logging.getLogger(__name__)
+
+# Read-mostly endpoints precomputed by warm_cache, as (resource, path). Requests
+# are made without a query string, matching the default views of the frontend.
+WARMUP_TARGETS = [
+    (ServiceListResource, '/api/services'),
+    (ServiceTypeListResource, '/api/service-types'),
+    (PopularServicesResource, '/api/services/popular'),
+]
+
+def warm_cache(app):
+    """
+    Precompute the cached responses of the read-mostly endpoints.
+
+    Each target's cached get() is called in a request context for its path, so
+    missing entries are computed and stored in the memory tier and in Redis,
+    while entries that are already fresh are left as they are.
+
+    Args:
+        app: Flask application to run the requests in
+
+    Returns:
+        dict: Status code of each warmed path
+    """
+    results = {}
+    for resource, path in WARMUP_TARGETS:
+        started = time.perf_counter()
+        try:
+            with app.test_request_context(path):
+                response = resource().get()
+            status = response[1] if isinstance(response, tuple) else response.status_code
+        except Exception as e:
+            logger.warning(f"Cache warmup failed for {path}: {e}")
+            status = None
+        results[path] = status
+        logger.info(f"Warmed {path} ({status}) in {(time.perf_counter() - started) * 1000:.1f} ms")
+    return results
+
+def warm_cache_on_start(app, use_reloader=False):
+    """
+    Warm the cache when a server starts, if CACHE_WARMUP_ON_START is set.
+
+    Call it from the server entry point rather than at import time, so CLI
+    commands importing the app do not warm it. With the development reloader
+    only the child process serving requests warms it, not the watcher.
+
+    Args:
+        app: Flask application to run the requests in
+        use_reloader (bool): Whether the server runs with the reloader
+
+    Returns:
+        dict: Status code of each warmed path, or None if skipped
+    """
+    if not app.config.get('CACHE_WARMUP_ON_START'):
+        return None
+    if use_reloader and os.environ.get('WERKZEUG_RUN_MAIN') != 'true':
+        return None
+    return warm_cache(app)
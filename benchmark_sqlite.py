@@ -0,0 +1,132 @@
+"""
+Compare concurrent read/write throughput of the SQLite profiles in Config.
+
+Each profile gets a fresh temporary database seeded with service requests.
+Reader threads run the professional dashboard style query (open requests by
+status, newest first) while writer threads create requests and accept them,
+like customers posting and professionals accepting at the same time.
+
+Usage: python benchmark_sqlite.py [--readers 8] [--writers 4] [--seconds 10] [--profiles default concurrent]
+"""
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+from collections import Counter
+from flask import Flask
+from sqlalchemy.exc import OperationalError
+from backend.config import Config
+from backend.engine import init_sqlite_profile
+from backend.model import db, User, Customer, Service, ServiceRequest
+
+def create_app(path, profile):
+    app = Flask(__name__)
+    app.config.from_object(Config)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{path}'
+    app.config['SQLITE_PROFILE'] = profile
+    db.init_app(app)
+    init_sqlite_profile(app, db)
+    return app
+
+def seed(app, requests):
+    with app.app_context():
+        db.create_all()
+        user = User(email='bench@example.com', password='x', role='customer')
+        db.session.add(user)
+        db.session.flush()
+        customer = Customer(user_id=user.id, name='Bench', address='Bench Street', pin=400001)
+        service = Service(name='Bench Service', price=100, time_req=1, service_type='Plumbing')
+        db.session.add_all([customer, service])
+        db.session.flush()
+        db.session.add_all([
+            ServiceRequest(service_id=service.id, customer_id=customer.customer_id, status=random.choice(['requested', 'assigned', 'closed']))
+            for _ in range(requests)
+        ])
+        db.session.commit()
+        return service.id, customer.customer_id
+
+def reader(app, stop, counts):
+    with app.app_context():
+        while not stop.is_set():
+            try:
+                ServiceRequest.query.filter_by(status='requested').order_by(ServiceRequest.req_date.desc()).limit(50).all()
+                counts['reads'] += 1
+            except OperationalError:
+                db.session.rollback()
+                counts['read_errors'] += 1
+            finally:
+                db.session.remove()
+
+def writer(app, stop, counts, service_id, customer_id):
+    with app.app_context():
+        while not stop.is_set():
+            try:
+                service_request = ServiceRequest(service_id=service_id, customer_id=customer_id)
+                db.session.add(service_request)
+                db.session.commit()
+                service_request.status = 'assigned'
+                db.session.commit()
+                counts['writes'] += 2
+            except OperationalError:
+                db.session.rollback()
+                counts['write_errors'] += 1
+            finally:
+                db.session.remove()
+
+def run(profile, readers, writers, seconds, requests):
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app(os.path.join(tmp, 'bench.db'), profile)
+        service_id, customer_id = seed(app, requests)
+
+        # Each thread counts into its own Counter; they are summed afterwards
+        stop = threading.Event()
+        thread_counts = [Counter() for _ in range(readers + writers)]
+        threads = [threading.Thread(target=reader, args=(app, stop, thread_counts[i])) for i in range(readers)]
+        threads += [
+            threading.Thread(target=writer, args=(app, stop, thread_counts[readers + i], service_id, customer_id))
+            for i in range(writers)
+        ]
+
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        time.sleep(seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        with app.app_context():
+            db.engine.dispose()
+
+    counts = sum(thread_counts, Counter())
+    return {
+        'profile': profile,
+        'reads_per_sec': counts['reads'] / elapsed,
+        'writes_per_sec': counts['writes'] / elapsed,
+        'read_errors': counts['read_errors'],
+        'write_errors': counts['write_errors']
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--writers', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--requests', type=int, default=5000, help='Service requests seeded before the run')
+    parser.add_argument('--profiles', nargs='+', default=list(Config.SQLITE_PROFILES))
+    args = parser.parse_args()
+
+    print(f"{args.readers} readers, {args.writers} writers, {args.seconds:g}s per profile")
+    print(f"{'profile':<12} {'reads/s':>10} {'writes/s':>10} {'read errors':>12} {'write errors':>13}")
+    for profile in args.profiles:
+        result = run(profile, args.readers, args.writers, args.seconds, args.requests)
+        print(
+            f"{result['profile']:<12} {result['reads_per_sec']:>10.1f} {result['writes_per_sec']:>10.1f} "
+            f"{result['read_errors']:>12} {result['write_errors']:>13}"
+        )
+
+if __name__ == '__main__':
+    main()
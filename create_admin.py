@@ -2,10 +2,12 @@ from flask import Flask
 from werkzeug.security import generate_password_hash
 from backend.config import Config
 from backend.model import db, User
+from backend.engine import init_sqlite_profile
 
 app = Flask(__name__)
 app.config.from_object(Config)
 db.init_app(app)
+init_sqlite_profile(app, db)
 
 def create_admin():
     with app.app_context():
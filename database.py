@@ -4,11 +4,13 @@ from datetime import datetime, timedelta
 import random
 
 from backend.config import Config
+from backend.engine import init_sqlite_profile
 from backend.model import db, User, Professional, Customer, Service, ServiceRequest, Review
 
 app = Flask(__name__)
 app.config.from_object(Config)
 db.init_app(app)
+init_sqlite_profile(app, db)
 
 # Service types and their corresponding services
 SERVICE_TYPES = {
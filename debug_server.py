@@ -1,4 +1,6 @@
 from app import app
+from backend.warmup import warm_cache_on_start
 
 if __name__ == "__main__":
+    warm_cache_on_start(app)
     app.run(debug=True, use_reloader=False) 
\ No newline at end of file
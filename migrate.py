@@ -0,0 +1,41 @@
+from flask import Flask
+from backend.config import Config
+from backend.model import db
+from backend.engine import init_sqlite_profile
+from backend.search import ensure_search_index
+
+app = Flask(__name__)
+app.config.from_object(Config)
+db.init_app(app)
+init_sqlite_profile(app, db)
+
+def upgrade():
+    """
+    Bring an existing database up to date with the current models without
+    recreating any tables. Safe to run repeatedly.
+    """
+    with app.app_context():
+        # Create any tables that are missing entirely
+        db.create_all()
+
+        # Add indexes that are declared on the models but missing in the database
+        created = []
+        for table in db.metadata.sorted_tables:
+            existing = {i['name'] for i in db.inspect(db.engine).get_indexes(table.name)}
+            for index in sorted(table.indexes, key=lambda i: i.name):
+                if index.name not in existing:
+                    index.create(bind=db.engine)
+                    created.append(index.name)
+                    print(f"Created index {index.name} on {table.name}")
+
+        # Create or rebuild the service request full-text search index
+        if ensure_search_index(app):
+            print("Search index is ready")
+
+        if not created:
+            print("Database is already up to date")
+        else:
+            print(f"Created {len(created)} indexes")
+
+if __name__ == "__main__":
+    upgrade()
@@ -0,0 +1,145 @@
+import os
+import sys
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+import pytest
+
+# Unit tests run without Redis; set before backend.cache is imported
+os.environ.setdefault('ENABLE_REDIS', 'false')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from flask_jwt_extended import JWTManager, create_access_token
+from sqlalchemy import event
+from backend.config import Config
+from backend.model import db, User, Professional, Customer, Service, ServiceRequest, Review
+from backend.engine import init_sqlite_profile
+from backend.routing import configure_read_engine
+from backend.routes import api_bp
+from backend.search import ensure_search_index
+from backend.invalidation import init_cache_invalidation
+from backend.catalog import service_catalog
+from backend import cache
+
+@pytest.fixture
+def app(tmp_path):
+    """
+    Application backed by a fresh database: the server at DATABASE_URL if set
+    (its tables are dropped afterwards), otherwise a temporary SQLite file.
+    """
+    app = Flask(__name__)
+    app.config.from_object(Config)
+    if 'DATABASE_URL' not in os.environ:
+        app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{tmp_path / 'test.db'}"
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {}
+    app.config['TESTING'] = True
+    JWTManager(app)
+
+    configure_read_engine(app)
+    db.init_app(app)
+    init_sqlite_profile(app, db)
+    init_cache_invalidation(db)
+    app.register_blueprint(api_bp)
+
+    # Cached responses and the catalog of a previous test's database
+    cache.memory_cache.clear()
+    service_catalog._snapshot = None
+
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        seed()
+        ensure_search_index(app)
+
+    yield app
+
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+        for engine in db.engines.values():
+            engine.dispose()
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+@pytest.fixture
+def auth(app):
+    """Authorization headers for the user with the given email"""
+    def headers(email):
+        with app.app_context():
+            user = User.query.filter_by(email=email).one()
+            token = create_access_token(identity=str(user.id), additional_claims={'role': user.role})
+        return {'Authorization': f'Bearer {token}'}
+    return headers
+
+def seed():
+    """
+    Small dataset: an admin, three services of two types, two professionals
+    (one approved), two customers and twelve service requests on consecutive
+    days, the closed ones reviewed.
+    """
+    db.session.add(User(email='admin@example.com', password='x', role='admin'))
+
+    services = [
+        Service(name='Pipe repair', price=300, time_req=2, description='Leaks and bursts', service_type='Plumbing'),
+        Service(name='Drain cleaning', price=200, time_req=1, description='Blocked drains', service_type='Plumbing'),
+        Service(name='Wiring', price=500, time_req=3, description='Sockets and switches', service_type='Electrical'),
+    ]
+    db.session.add_all(services)
+
+    professionals = []
+    for i, (service_type, approved) in enumerate([('Plumbing', True), ('Electrical', False)]):
+        user = User(email=f'pro{i}@example.com', password='x', role='professional')
+        professionals.append(Professional(
+            user=user, name=f'Pro {i}', service_type=service_type, pin=400001,
+            approved=approved, created_date=datetime(2025, 1, 1 + i)
+        ))
+    customers = []
+    for i in range(2):
+        user = User(email=f'cust{i}@example.com', password='x', role='customer')
+        customers.append(Customer(
+            user=user, name=f'Customer {i}', address=f'{i} Main Road', pin=400001 + i,
+            created_date=datetime(2025, 1, 1 + i)
+        ))
+    db.session.add_all(professionals + customers)
+    db.session.flush()
+
+    for i in range(12):
+        status = ['requested', 'assigned', 'closed', 'closed'][i % 4]
+        req = ServiceRequest(
+            service=services[i % 3], customer=customers[i % 2],
+            professional_id=professionals[0].professional_id if status != 'requested' else None,
+            req_date=datetime(2025, 1, 1, 9) + timedelta(days=i), status=status,
+            remarks=f'Request {i}' + (' kitchen leak' if i % 4 == 0 else '')
+        )
+        if status == 'closed':
+            req.comp_date = req.req_date + timedelta(hours=3)
+        db.session.add(req)
+        db.session.flush()
+        if status == 'closed':
+            db.session.add(Review(
+                service_request_id=req.id, customer_id=req.customer_id, rating=1 + i % 5,
+                date_created=req.comp_date
+            ))
+    db.session.commit()
+
+@pytest.fixture
+def count_queries(app):
+    """Context manager counting the statements executed on every engine"""
+    @contextmanager
+    def counter():
+        statements = []
+        def record(*args):
+            statements.append(args[2])
+        with app.app_context():
+            engines = list(db.engines.values())
+        for engine in engines:
+            event.listen(engine, 'before_cursor_execute', record)
+        try:
+            yield statements
+        finally:
+            for engine in engines:
+                event.remove(engine, 'before_cursor_execute', record)
+    return counter
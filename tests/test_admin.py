@@ -0,0 +1,158 @@
+from datetime import datetime
+from backend.model import db, User, Professional, Customer
+
+def professional_stats(data):
+    return [(p['name'], p['stats']['total_requests'], p['stats']['completed_requests'], p['stats']['average_rating'])
+            for p in data['professionals']]
+
+def test_professionals_list_stats(client, auth):
+    headers = auth('admin@example.com')
+    data = client.get('/api/admin/professionals', headers=headers).get_json()
+    assert data['total'] == 2
+    # Newest first by default
+    assert professional_stats(data) == [('Pro 1', 0, 0, 0), ('Pro 0', 9, 6, 2.5)]
+    assert data['professionals'][1]['email'] == 'pro0@example.com'
+
+    data = client.get('/api/admin/professionals?sort=rating', headers=headers).get_json()
+    assert [p['name'] for p in data['professionals']] == ['Pro 0', 'Pro 1']
+    data = client.get('/api/admin/professionals?status=pending', headers=headers).get_json()
+    assert [p['name'] for p in data['professionals']] == ['Pro 1']
+    assert client.get('/api/admin/professionals?sort=unknown', headers=headers).status_code == 400
+
+def test_professionals_list_pages(client, auth):
+    headers = auth('admin@example.com')
+    data = client.get('/api/admin/professionals?page=2&page_size=1', headers=headers).get_json()
+    assert (data['total'], data['pages'], data['current_page']) == (2, 2, 2)
+    assert professional_stats(data) == [('Pro 0', 9, 6, 2.5)]
+    for query in ('page=0', 'page_size=0', 'page=1&page_size=101'):
+        assert client.get(f'/api/admin/professionals?{query}', headers=headers).status_code == 400
+
+def test_professionals_list_query_count_does_not_grow_with_rows(app, client, auth, count_queries):
+    headers = auth('admin@example.com')
+    with count_queries() as before:
+        client.get('/api/admin/professionals', headers=headers)
+
+    with app.app_context():
+        for i in range(10):
+            user = User(email=f'extra{i}@example.com', password='x', role='professional')
+            db.session.add(Professional(user=user, name=f'Extra {i}', service_type='Plumbing', created_date=datetime(2025, 2, 1)))
+        db.session.commit()
+
+    with count_queries() as after:
+        data = client.get('/api/admin/professionals', headers=headers).get_json()
+    assert data['total'] == 12
+    assert len(after) == len(before)
+
+def customer_stats(data):
+    return [(c['name'], c['stats']['total_requests'], c['stats']['completed_requests'], c['stats']['reviews_count'])
+            for c in data['customers']]
+
+def test_customers_list_stats(client, auth):
+    headers = auth('admin@example.com')
+    data = client.get('/api/admin/customers', headers=headers).get_json()
+    assert data['total'] == 2
+    assert customer_stats(data) == [('Customer 1', 6, 3, 3), ('Customer 0', 6, 3, 3)]
+    assert data['customers'][0]['email'] == 'cust1@example.com'
+
+    # Equal counts keep customer id order
+    data = client.get('/api/admin/customers?sort=requests', headers=headers).get_json()
+    assert [c['name'] for c in data['customers']] == ['Customer 0', 'Customer 1']
+    assert client.get('/api/admin/customers?sort=unknown', headers=headers).status_code == 400
+
+def test_customers_list_filters(client, auth):
+    headers = auth('admin@example.com')
+    def names(query):
+        data = client.get(f'/api/admin/customers?{query}', headers=headers).get_json()
+        return [c['name'] for c in data['customers']]
+
+    assert names('pin=400002') == ['Customer 1']
+    assert names('pin=4000%25') == []
+    assert names('name=tomer 0') == ['Customer 0']
+    assert names('name=%25') == []
+    assert names('status=active') == ['Customer 1', 'Customer 0']
+    assert names('status=blocked') == []
+
+def test_customers_list_pages(client, auth):
+    headers = auth('admin@example.com')
+    data = client.get('/api/admin/customers?page=1&page_size=1', headers=headers).get_json()
+    assert (data['total'], data['pages'], data['current_page']) == (2, 2, 1)
+    assert customer_stats(data) == [('Customer 1', 6, 3, 3)]
+    for query in ('page=0', 'page_size=0', 'page=-1&page_size=10'):
+        assert client.get(f'/api/admin/customers?{query}', headers=headers).status_code == 400
+
+def test_users_list_one_row_per_user(app, client, auth):
+    headers = auth('admin@example.com')
+    with app.app_context():
+        # Duplicate profiles: the first one created is listed
+        pro_user = User.query.filter_by(email='pro0@example.com').one()
+        cust_user = User.query.filter_by(email='cust1@example.com').one()
+        db.session.add(Professional(user_id=pro_user.id, name='Pro 0 again', service_type='Electrical', created_date=datetime(2025, 3, 1)))
+        db.session.add(Customer(user_id=cust_user.id, name='Customer 1 again', address='1 Main Road', pin=400002, created_date=datetime(2025, 3, 1)))
+        db.session.commit()
+
+    users = client.get('/api/admin/users', headers=headers).get_json()
+    assert [u['email'] for u in users] == [
+        'admin@example.com', 'pro0@example.com', 'pro1@example.com', 'cust0@example.com', 'cust1@example.com'
+    ]
+    assert 'professional' not in users[0] and 'customer' not in users[0]
+    assert users[1]['professional']['name'] == 'Pro 0'
+    assert users[4]['customer']['name'] == 'Customer 1'
+
+    data = client.get('/api/admin/users?page=2&page_size=2', headers=headers).get_json()
+    assert (data['total'], data['pages'], data['current_page']) == (5, 3, 2)
+    assert [u['email'] for u in data['users']] == ['pro1@example.com', 'cust0@example.com']
+
+def test_users_list_filters(client, auth):
+    headers = auth('admin@example.com')
+    def emails(query):
+        return [u['email'] for u in client.get(f'/api/admin/users?{query}', headers=headers).get_json()]
+
+    assert emails('role=customer') == ['cust0@example.com', 'cust1@example.com']
+    assert emails('role=professional&status=pending') == ['pro1@example.com']
+    assert emails('role=professional&service_type=Plumbing') == ['pro0@example.com']
+    assert emails('name=Customer 1') == ['admin@example.com', 'cust1@example.com']
+    for query in ('page=0', 'page_size=0', 'page_size=101'):
+        assert client.get(f'/api/admin/users?{query}', headers=headers).status_code == 400
+
+def test_professional_detail(client, auth):
+    headers = auth('admin@example.com')
+    data = client.get('/api/admin/professionals/1', headers=headers).get_json()
+    assert data['email'] == 'pro0@example.com'
+    assert data['stats'] == {'total_requests': 9, 'completed_requests': 6, 'average_rating': 2.5}
+    # Five most recent by default
+    assert [r['id'] for r in data['recent_requests']] == [12, 11, 10, 8, 7]
+    assert data['recent_requests'][0] == {
+        'id': 12, 'service': 'Wiring', 'customer': 'Customer 1', 'date': '2025-01-12 09:00', 'status': 'closed'
+    }
+    assert 'page' not in data
+
+    data = client.get('/api/admin/professionals/1?page=2', headers=headers).get_json()
+    assert (data['page'], data['pages']) == (2, 2)
+    assert [r['id'] for r in data['recent_requests']] == [6, 4, 3, 2]
+
+    data = client.get('/api/admin/professionals/2', headers=headers).get_json()
+    assert data['stats'] == {'total_requests': 0, 'completed_requests': 0, 'average_rating': 0}
+    assert data['recent_requests'] == []
+
+    assert client.get('/api/admin/professionals/1?page=0', headers=headers).status_code == 400
+    assert client.get('/api/admin/professionals/99', headers=headers).status_code == 404
+
+def test_customer_detail(client, auth):
+    headers = auth('admin@example.com')
+    data = client.get('/api/admin/customers/1', headers=headers).get_json()
+    assert data['email'] == 'cust0@example.com'
+    assert data['stats'] == {
+        'total_requests': 6, 'completed_requests': 3, 'reviews_count': 3, 'average_rating_given': 2.0
+    }
+    assert [r['id'] for r in data['recent_requests']] == [11, 9, 7, 5, 3]
+    assert data['recent_requests'][0] == {
+        'id': 11, 'service': 'Drain cleaning', 'professional': 'Pro 0', 'date': '2025-01-11 09:00', 'status': 'closed'
+    }
+    assert data['recent_requests'][1]['professional'] == 'Unassigned'
+
+    data = client.get('/api/admin/customers/1?page=3&page_size=2', headers=headers).get_json()
+    assert (data['page'], data['pages']) == (3, 3)
+    assert [r['id'] for r in data['recent_requests']] == [3, 1]
+
+    assert client.get('/api/admin/customers/1?page_size=0', headers=headers).status_code == 400
+    assert client.get('/api/admin/customers/99', headers=headers).status_code == 404
@@ -0,0 +1,73 @@
+import json
+import pytest
+from backend import cache
+from backend.broadcast import InProcessBroker
+
+@pytest.fixture
+def broker():
+    broker = InProcessBroker()
+    cache.set_invalidation_broker(broker)
+    yield broker
+    cache.set_invalidation_broker(None)
+
+def test_publish_fans_out_to_every_subscriber():
+    broker = InProcessBroker()
+    received = []
+    broker.subscribe('channel', lambda message: received.append(('a', message)))
+    broker.subscribe('channel', lambda message: received.append(('b', message)))
+    broker.subscribe('other', lambda message: received.append(('c', message)))
+
+    broker.publish('channel', 'hello')
+
+    assert received == [('a', 'hello'), ('b', 'hello')]
+
+def test_subscribe_calls_on_connect():
+    broker = InProcessBroker()
+    connected = []
+    broker.subscribe('channel', lambda message: None, on_connect=lambda: connected.append(True))
+    assert connected == [True]
+    assert broker.connected
+
+def test_close_drops_subscribers():
+    broker = InProcessBroker()
+    received = []
+    broker.subscribe('channel', received.append)
+    broker.close()
+    broker.publish('channel', 'hello')
+    assert received == []
+
+def test_invalidation_is_published(broker):
+    received = []
+    broker.subscribe(cache.INVALIDATION_CHANNEL, lambda message: received.append(json.loads(message)))
+
+    cache.invalidate_cache_prefix('tests:published:')
+
+    assert len(received) == 1
+    assert received[0]['origin'] == cache.WORKER_ID
+    assert received[0]['namespace'] == 'tests:published'
+    assert received[0]['generation'] == cache.local_generations['tests:published']
+
+def test_remote_invalidation_bumps_local_generation(broker):
+    broker.publish(cache.INVALIDATION_CHANNEL, json.dumps({
+        'origin': 'another-worker',
+        'namespace': 'tests:remote',
+        'generation': 'abc123'
+    }))
+    assert cache.local_generations['tests:remote'] == 'abc123'
+
+def test_own_invalidation_is_not_applied_twice(broker):
+    cache.invalidate_cache_prefix('tests:own')
+    generation = cache.local_generations['tests:own']
+
+    # A late echo of an older message from this worker must not roll it back
+    broker.publish(cache.INVALIDATION_CHANNEL, json.dumps({
+        'origin': cache.WORKER_ID,
+        'namespace': 'tests:own',
+        'generation': 'old'
+    }))
+    assert cache.local_generations['tests:own'] == generation
+
+def test_broker_connect_clears_memory_tier(broker):
+    cache.memory_cache.set('tests:key', cache.CacheEntry.from_body(b'{}', 0), 60, size=2)
+    broker.subscribe('channel', lambda message: None, on_connect=cache._on_broker_connect)
+    assert 'tests:key' not in cache.memory_cache
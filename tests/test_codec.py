@@ -0,0 +1,37 @@
+import pytest
+from backend.codec import PayloadCodec, encode_json, msgpack
+
+BODY = encode_json({'services': [{'id': i, 'name': f'Service {i}'} for i in range(100)]})
+
+def test_small_payloads_are_stored_uncompressed():
+    codec = PayloadCodec('json', 'zlib', threshold=1024)
+    payload = codec.dumps(b'{"a":1}')
+    assert payload == b'\x00{"a":1}'
+    assert codec.loads(payload) == b'{"a":1}'
+
+def test_large_payloads_are_compressed():
+    codec = PayloadCodec('json', 'zlib', threshold=1024)
+    payload = codec.dumps(BODY)
+    assert payload[0] == 0x01  # JSON, zlib
+    assert len(payload) < len(BODY)
+    assert codec.loads(payload) == BODY
+
+def test_payloads_decode_with_any_configured_codec():
+    written = PayloadCodec('json', 'zlib', threshold=0).dumps(BODY)
+    assert PayloadCodec('json', 'none').loads(written) == BODY
+
+def test_unknown_header_is_rejected():
+    with pytest.raises(ValueError):
+        PayloadCodec().loads(b'\xff{}')
+
+def test_unknown_codec_falls_back_to_json():
+    codec = PayloadCodec('unknown', 'unknown')
+    assert codec.codec.name == 'json'
+    assert codec.compression.name == 'none'
+
+@pytest.mark.skipif(msgpack is None, reason='msgpack is not installed')
+def test_msgpack_round_trip():
+    codec = PayloadCodec('msgpack', 'none')
+    payload = codec.dumps(BODY)
+    assert payload[0] >> 4 == 1
+    assert codec.loads(payload) == BODY
@@ -0,0 +1,50 @@
+from backend.model import db, Customer, Review, ServiceRequest
+from backend.invalidation import PENDING_KEY, collapse_namespaces
+
+def blocked(client, headers):
+    data = client.get('/api/admin/customers', headers=headers).get_json()
+    return {c['name']: c['blocked'] for c in data['customers']}
+
+def test_responses_are_cached_until_a_commit(app, client, auth):
+    headers = auth('admin@example.com')
+    assert blocked(client, headers) == {'Customer 1': False, 'Customer 0': False}
+
+    # Bypassing the session leaves the cached response in place
+    with app.app_context():
+        with db.engine.begin() as connection:
+            connection.execute(db.update(Customer).where(Customer.customer_id == 1).values(blocked=True))
+    assert blocked(client, headers) == {'Customer 1': False, 'Customer 0': False}
+
+    with app.app_context():
+        db.session.get(Customer, 2).blocked = True
+        db.session.commit()
+    assert blocked(client, headers) == {'Customer 1': True, 'Customer 0': True}
+
+def test_new_rows_invalidate_dependent_namespaces(app, client, auth):
+    headers = auth('admin@example.com')
+    def pro0_rating():
+        data = client.get('/api/admin/professionals/1', headers=headers).get_json()
+        return data['stats']['average_rating']
+    assert pro0_rating() == 2.5
+
+    with app.app_context():
+        # Request 10 was assigned to Pro 0 and is not reviewed yet
+        db.session.get(ServiceRequest, 10).status = 'closed'
+        db.session.add(Review(service_request_id=10, customer_id=2, rating=5))
+        db.session.commit()
+    assert pro0_rating() == 2.9
+
+def test_rolled_back_changes_are_discarded(app, client, auth):
+    headers = auth('admin@example.com')
+    with app.app_context():
+        db.session.get(Customer, 1).blocked = True
+        db.session.flush()
+        assert 'admin:customers' in db.session.info[PENDING_KEY]
+        db.session.rollback()
+        assert PENDING_KEY not in db.session.info
+    assert blocked(client, headers) == {'Customer 1': False, 'Customer 0': False}
+
+def test_collapse_namespaces():
+    assert collapse_namespaces({'services', 'services:detail:5', 'service_types', 'reviews'}) == [
+        'reviews', 'service_types', 'services'
+    ]
@@ -0,0 +1,53 @@
+import time
+from backend.cache import LRUCache
+
+def test_evicts_least_recently_used_beyond_max_entries():
+    removed = []
+    lru = LRUCache(max_entries=2, max_bytes=1000, on_remove=lambda key, reason: removed.append((key, reason)))
+    lru.set('a', 1, 60)
+    lru.set('b', 2, 60)
+    lru.get('a')  # 'b' is now the least recently used
+    lru.set('c', 3, 60)
+
+    assert lru.keys() == ['a', 'c']
+    assert removed == [('b', 'eviction')]
+    assert lru.stats()['evictions'] == 1
+
+def test_evicts_to_stay_within_max_bytes():
+    lru = LRUCache(max_entries=100, max_bytes=10)
+    lru.set('a', 'x', 60, size=4)
+    lru.set('b', 'y', 60, size=4)
+    lru.set('c', 'z', 60, size=4)
+
+    assert lru.keys() == ['b', 'c']
+    assert lru.total_bytes == 8
+
+def test_skips_values_larger_than_max_bytes():
+    lru = LRUCache(max_entries=100, max_bytes=10)
+    lru.set('big', 'x' * 20, 60)
+    assert 'big' not in lru
+    assert lru.total_bytes == 0
+
+def test_replacing_a_key_updates_its_size():
+    lru = LRUCache(max_entries=100, max_bytes=100)
+    lru.set('a', 'x', 60, size=30)
+    lru.set('a', 'y', 60, size=10)
+    assert lru.get('a') == 'y'
+    assert lru.total_bytes == 10
+
+def test_expired_entries_are_misses():
+    removed = []
+    lru = LRUCache(max_entries=100, max_bytes=100, on_remove=lambda key, reason: removed.append((key, reason)))
+    lru.set('a', 1, -1)
+    assert lru.get('a') is None
+    assert removed == [('a', 'expiration')]
+    assert lru.stats()['expirations'] == 1
+
+def test_expired_entries_are_evicted_before_recent_ones():
+    lru = LRUCache(max_entries=2, max_bytes=1000)
+    lru.set('fresh', 1, 60)
+    lru.set('expired', 2, 0.01)
+    time.sleep(0.02)
+    lru.set('new', 3, 60)
+    assert lru.keys() == ['fresh', 'new']
+    assert lru.stats()['evictions'] == 0
@@ -0,0 +1,26 @@
+from datetime import date, datetime
+from backend.model import db, ServiceRequest, Review
+from backend.queries import date_of, average, load_rating_summary
+
+def test_date_of_groups_by_calendar_day(app):
+    with app.app_context():
+        db.session.add(ServiceRequest(service_id=1, customer_id=1, req_date=datetime(2025, 1, 1, 23, 59)))
+        db.session.commit()
+
+        day = date_of(ServiceRequest.req_date)
+        rows = db.session.query(day, db.func.count(ServiceRequest.id)).group_by(day).order_by(day).all()
+
+        assert rows[0] == (date(2025, 1, 1), 2)
+        assert rows[1] == (date(2025, 1, 2), 1)
+        assert len(rows) == 12
+
+def test_average_is_a_float(app):
+    with app.app_context():
+        value = db.session.query(average(Review.rating)).scalar()
+        assert isinstance(value, float)
+        assert value == 2.5
+
+def test_rating_summary(app):
+    with app.app_context():
+        assert load_rating_summary(Review.query) == (6, 2.5)
+        assert load_rating_summary(Review.query.filter(Review.rating > 5)) == (0, None)
@@ -0,0 +1,26 @@
+import base64
+from datetime import datetime
+import pytest
+from backend.queries import encode_cursor, decode_cursor
+
+def test_cursor_round_trip():
+    position = (0, datetime(2025, 1, 10, 9, 30, 15), 42)
+    assert decode_cursor(encode_cursor(*position)) == position
+
+def test_cursor_round_trip_without_date():
+    assert decode_cursor(encode_cursor(1, None, 42)) == (1, None, 42)
+
+def test_cursor_is_url_safe():
+    cursor = encode_cursor(1, datetime(2025, 1, 10), 7)
+    assert base64.urlsafe_b64decode(cursor)
+    assert not set(cursor) & set('+/')
+
+@pytest.mark.parametrize('cursor', [
+    'not base64!',
+    base64.urlsafe_b64encode(b'not json').decode(),
+    base64.urlsafe_b64encode(b'[1, 2]').decode(),
+    base64.urlsafe_b64encode(b'[0, "not a date", 1]').decode(),
+])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
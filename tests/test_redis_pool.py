@@ -0,0 +1,84 @@
+import pytest
+import redis
+from backend.redis_pool import RedisCircuitBreaker, GuardedRedis, CircuitOpenError
+
+class FakeProbe:
+    def __init__(self, healthy=True):
+        self.healthy = healthy
+
+    def __call__(self):
+        if not self.healthy:
+            raise redis.exceptions.ConnectionError('down')
+
+class FakeClient:
+    def __init__(self):
+        self.error = None
+
+    def get(self, key):
+        if self.error:
+            raise self.error
+        return 'value'
+
+def make_breaker(probe, **kwargs):
+    # A long reset timeout keeps the background reconnection thread asleep
+    return RedisCircuitBreaker(probe, failure_threshold=2, reset_timeout=60, max_reset_timeout=60, **kwargs)
+
+def test_starts_open_and_closes_on_successful_probe():
+    closed = []
+    breaker = make_breaker(FakeProbe(), on_close=lambda: closed.append(True))
+    assert not breaker.allow()
+
+    assert breaker.probe()
+    assert breaker.allow()
+    assert closed == [True]
+
+def test_failed_probe_keeps_circuit_open():
+    breaker = make_breaker(FakeProbe(healthy=False))
+    assert not breaker.probe()
+    assert breaker.state == RedisCircuitBreaker.OPEN
+    assert breaker.last_error == 'down'
+
+def test_opens_after_consecutive_failures():
+    breaker = make_breaker(FakeProbe())
+    breaker.probe()
+
+    breaker.record_failure(ConnectionError('timeout'))
+    assert breaker.allow()
+    breaker.record_failure(ConnectionError('timeout'))
+    assert not breaker.allow()
+    assert breaker.trips == 1
+
+def test_success_resets_failure_count():
+    breaker = make_breaker(FakeProbe())
+    breaker.probe()
+
+    breaker.record_failure(ConnectionError('timeout'))
+    breaker.record_success()
+    breaker.record_failure(ConnectionError('timeout'))
+    assert breaker.allow()
+
+def test_guarded_client_fails_fast_while_open():
+    client = FakeClient()
+    guarded = GuardedRedis(client, make_breaker(FakeProbe(healthy=False)))
+    with pytest.raises(CircuitOpenError):
+        guarded.get('key')
+
+def test_guarded_client_reports_outcomes():
+    client = FakeClient()
+    breaker = make_breaker(FakeProbe())
+    breaker.probe()
+    guarded = GuardedRedis(client, breaker)
+    assert guarded.get('key') == 'value'
+
+    # A command error is Redis answering, not a failure
+    client.error = redis.exceptions.ResponseError('WRONGTYPE')
+    for _ in range(3):
+        with pytest.raises(redis.exceptions.ResponseError):
+            guarded.get('key')
+    assert breaker.allow()
+
+    client.error = redis.exceptions.ConnectionError('refused')
+    for _ in range(2):
+        with pytest.raises(redis.exceptions.ConnectionError):
+            guarded.get('key')
+    assert not breaker.allow()
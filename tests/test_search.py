@@ -0,0 +1,45 @@
+import pytest
+from backend.model import db, Service, Customer, ServiceRequest
+from backend.search import search_index_available
+
+def search(client, headers, term):
+    data = client.get(f'/api/service-requests?search={term}', headers=headers).get_json()
+    return sorted(r['id'] for r in data['requests'])
+
+def test_search_matches_remarks_service_and_customer_names(client, auth):
+    headers = auth('admin@example.com')
+    assert search(client, headers, 'kitchen') == [1, 5, 9]
+    assert search(client, headers, 'wiring') == [3, 6, 9, 12]
+    assert search(client, headers, 'customer 1') == [2, 4, 6, 8, 10, 12]
+    assert search(client, headers, 'nothing like this') == []
+
+def test_search_uses_the_index_on_sqlite(app):
+    with app.app_context():
+        if db.engine.dialect.name != 'sqlite':
+            pytest.skip('FTS5 is SQLite only')
+        assert search_index_available(app)
+
+def test_search_follows_inserted_updated_and_deleted_requests(app, client, auth):
+    headers = auth('admin@example.com')
+    response = client.post('/api/service-requests', headers=auth('cust0@example.com'),
+                           json={'service_id': 1, 'remarks': 'garden hose'})
+    new_id = response.get_json()['id']
+    assert search(client, headers, 'garden') == [new_id]
+
+    client.put(f'/api/service-requests/{new_id}', headers=headers, json={'remarks': 'balcony tap'})
+    assert search(client, headers, 'garden') == []
+    assert search(client, headers, 'balcony') == [new_id]
+
+    with app.app_context():
+        db.session.delete(db.session.get(ServiceRequest, new_id))
+        db.session.commit()
+    assert search(client, headers, 'balcony') == []
+
+def test_search_follows_renamed_services_and_customers(app, client, auth):
+    headers = auth('admin@example.com')
+    with app.app_context():
+        db.session.get(Service, 3).name = 'Rewiring'
+        db.session.get(Customer, 2).name = 'Harriet'
+        db.session.commit()
+    assert search(client, headers, 'rewiring') == [3, 6, 9, 12]
+    assert search(client, headers, 'harriet') == [2, 4, 6, 8, 10, 12]
@@ -0,0 +1,141 @@
+from datetime import datetime, timedelta
+from backend.model import db, ServiceRequest
+from backend.catalog import service_catalog
+from backend.queries import load_service_request_page
+
+def test_admin_listing_includes_related_rows(client, auth):
+    response = client.get('/api/service-requests', headers=auth('admin@example.com'))
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['count'] == 12
+    assert [r['id'] for r in data['requests']] == list(range(1, 13))
+
+    closed = data['requests'][2]
+    assert closed['service_name'] == 'Wiring'
+    assert closed['service_type'] == 'Electrical'
+    assert closed['price'] == 500
+    assert closed['duration'] == 3
+    assert closed['customer_name'] == 'Customer 0'
+    assert closed['customer_address'] == '0 Main Road'
+    assert closed['professional_name'] == 'Pro 0'
+    assert closed['comp_date'] == '2025-01-03 12:00:00'
+    assert closed['has_review'] is True
+
+    requested = data['requests'][0]
+    assert 'professional_id' not in requested
+    assert requested['has_review'] is False
+
+def test_listing_is_scoped_to_the_caller(client, auth):
+    data = client.get('/api/service-requests', headers=auth('cust1@example.com')).get_json()
+    assert data['count'] == 6
+    assert {r['customer_name'] for r in data['requests']} == {'Customer 1'}
+
+def test_requests_without_a_service_are_dropped(app, client, auth):
+    with app.app_context():
+        db.session.add(ServiceRequest(service_id=None, customer_id=1, req_date=datetime(2025, 2, 1)))
+        db.session.commit()
+    data = client.get('/api/service-requests', headers=auth('admin@example.com')).get_json()
+    assert data['count'] == 12
+
+def test_listing_query_count_does_not_grow_with_rows(app, client, auth, count_queries):
+    headers = auth('admin@example.com')
+    with app.app_context():
+        service_catalog.snapshot()
+    with count_queries() as before:
+        client.get('/api/service-requests', headers=headers)
+
+    with app.app_context():
+        db.session.add_all([
+            ServiceRequest(service_id=1 + i % 3, customer_id=1 + i % 2, professional_id=1,
+                           req_date=datetime(2025, 3, 1), status='assigned')
+            for i in range(20)
+        ])
+        db.session.commit()
+
+    with count_queries() as after:
+        data = client.get('/api/service-requests', headers=headers).get_json()
+    assert data['count'] == 32
+    assert len(after) == len(before)
+
+def read_pages(client, headers, page_size):
+    rows, cursor, pages = [], None, 0
+    while True:
+        url = f'/api/service-requests?page_size={page_size}' + (f'&cursor={cursor}' if cursor else '')
+        response = client.get(url, headers=headers)
+        assert response.status_code == 200
+        data = response.get_json()
+        rows += data['requests']
+        pages += 1
+        cursor = data['next_cursor']
+        if not cursor:
+            return rows, pages
+
+def test_keyset_pages_cover_every_request_once_newest_first(client, auth):
+    rows, pages = read_pages(client, auth('admin@example.com'), 5)
+    assert pages == 3
+    assert [r['id'] for r in rows] == list(range(12, 0, -1))
+
+def test_keyset_pages_put_open_requests_first_for_professionals(client, auth):
+    headers = auth('pro0@example.com')
+    everything = client.get('/api/service-requests', headers=headers).get_json()['requests']
+    rows, _ = read_pages(client, headers, 2)
+
+    expected = sorted(everything, key=lambda r: (r['req_date'], r['id']), reverse=True)
+    expected.sort(key=lambda r: r['status'] != 'requested')
+    assert [r['id'] for r in rows] == [r['id'] for r in expected]
+    assert rows[0]['status'] == 'requested'
+
+def test_keyset_pages_continue_past_undated_requests(app, client, auth):
+    with app.app_context():
+        for request_id in (3, 7, 8):
+            db.session.get(ServiceRequest, request_id).req_date = None
+        db.session.commit()
+
+        # Undated requests come last, newest id first
+        query = ServiceRequest.query
+        rows, cursor = load_service_request_page(query, page_size=4)
+        ids = [row[0].id for row in rows]
+        while cursor:
+            rows, cursor = load_service_request_page(query, cursor=cursor, page_size=4)
+            ids += [row[0].id for row in rows]
+        assert ids == [12, 11, 10, 9, 6, 5, 4, 2, 1, 8, 7, 3]
+
+    # The listing follows the cursors to the end without failing
+    rows, pages = read_pages(client, auth('admin@example.com'), 4)
+    assert pages == 3
+    assert [r['id'] for r in rows] == [12, 11, 10, 9, 6, 5, 4, 2, 1]
+
+def test_invalid_paging_parameters_are_rejected(client, auth):
+    headers = auth('admin@example.com')
+    assert client.get('/api/service-requests?cursor=not-a-cursor', headers=headers).status_code == 400
+    assert client.get('/api/service-requests?page_size=0', headers=headers).status_code == 400
+
+def test_admin_stats(client, auth):
+    data = client.get('/api/service-requests/stats', headers=auth('admin@example.com')).get_json()
+    assert (data['total_requests'], data['pending_requests'], data['assigned_requests'], data['completed_requests']) == (12, 3, 3, 6)
+    assert [a['id'] for a in data['recent_activity']] == [12, 11, 10, 9, 8]
+    assert data['recent_activity'][0] == {
+        'id': 12, 'service': 'Wiring', 'customer': 'Customer 1', 'status': 'closed', 'date': '2025-01-12 09:00:00'
+    }
+    assert 'daily' not in data
+
+def test_professional_stats(client, auth):
+    data = client.get('/api/service-requests/stats', headers=auth('pro0@example.com')).get_json()
+    assert (data['total_requests'], data['pending_requests'], data['completed_requests']) == (9, 3, 6)
+    assert len(data['recent_activity']) == 5
+    assert client.get('/api/service-requests/stats', headers=auth('cust0@example.com')).status_code == 403
+
+def test_daily_stats(app, client, auth):
+    today = datetime.now().replace(hour=0, minute=30, second=0, microsecond=0)
+    with app.app_context():
+        db.session.add_all([
+            ServiceRequest(service_id=1, customer_id=1, req_date=today, status='requested'),
+            ServiceRequest(service_id=2, customer_id=2, req_date=today, status='closed'),
+            ServiceRequest(service_id=2, customer_id=2, req_date=today - timedelta(days=2), status='closed'),
+        ])
+        db.session.commit()
+
+    data = client.get('/api/service-requests/stats?days=3', headers=auth('admin@example.com')).get_json()
+    assert [(d['total'], d['completed']) for d in data['daily']] == [(1, 1), (0, 0), (2, 1)]
+    assert data['daily'][-1]['date'] == today.strftime('%Y-%m-%d')
+    assert client.get('/api/service-requests/stats?days=0', headers=auth('admin@example.com')).status_code == 400
@@ -0,0 +1,73 @@
+from backend import catalog
+from backend.catalog import service_catalog
+from backend.model import db, Service
+from backend.queries import resolve_services
+
+def test_popular_services_are_ranked_by_requests_and_ratings(app, client):
+    with app.app_context():
+        db.session.add(Service(name='Painting', price=800, time_req=8, service_type='Painting'))
+        db.session.commit()
+
+    data = client.get('/api/services/popular?limit=10').get_json()
+    assert [(s['name'], s['request_count'], s['avg_rating'], s['popularity_score']) for s in data] == [
+        ('Pipe repair', 4, 3.0, 11.8),
+        ('Wiring', 4, 2.5, 10.3),
+        ('Drain cleaning', 4, 2.0, 8.8),
+        ('Painting', 0, None, 0.0),
+    ]
+
+def test_popular_services_limit_and_type(client):
+    assert [s['name'] for s in client.get('/api/services/popular?limit=2').get_json()] == ['Pipe repair', 'Wiring']
+    assert [s['name'] for s in client.get('/api/services/popular?service_type=Plumbing').get_json()] == [
+        'Pipe repair', 'Drain cleaning'
+    ]
+    assert client.get('/api/services/popular?limit=0').status_code == 400
+
+def test_services_follow_admin_changes(client, auth):
+    headers = auth('admin@example.com')
+    def names():
+        return [s['name'] for s in client.get('/api/services').get_json()]
+    assert names() == ['Pipe repair', 'Drain cleaning', 'Wiring']
+
+    response = client.post('/api/services', headers=headers, json={
+        'name': 'Painting', 'price': 800, 'time_req': 8, 'service_type': 'Painting'
+    })
+    service_id = response.get_json()['id']
+    assert names() == ['Pipe repair', 'Drain cleaning', 'Wiring', 'Painting']
+    assert client.get('/api/service-types').get_json()[-1] == 'Painting'
+
+    client.put(f'/api/services/{service_id}', headers=headers, json={'name': 'Wall painting', 'price': 900})
+    assert client.get(f'/api/services/{service_id}').get_json()['price'] == 900
+    assert names()[-1] == 'Wall painting'
+
+    client.delete(f'/api/services/{service_id}', headers=headers)
+    assert client.get(f'/api/services/{service_id}').status_code == 404
+    assert names() == ['Pipe repair', 'Drain cleaning', 'Wiring']
+
+def test_catalog_rebuilds_when_it_misses_a_committed_service(app, monkeypatch):
+    with app.app_context():
+        service_catalog.snapshot()
+        # Committed without the session, as by a worker whose invalidation never arrives
+        with db.engine.begin() as connection:
+            service_id = connection.execute(db.insert(Service).values(
+                name='Painting', price=800, time_req=8, description='', service_type='Painting'
+            ).returning(Service.id)).scalar()
+
+        # A snapshot younger than the minimum refresh interval is kept
+        monkeypatch.setattr(catalog, 'CATALOG_MIN_REFRESH_INTERVAL', 3600)
+        assert service_catalog.get(service_id) is None
+
+        monkeypatch.setattr(catalog, 'CATALOG_MIN_REFRESH_INTERVAL', 0)
+        assert resolve_services([service_id, 1])[service_id].name == 'Painting'
+        assert service_catalog.get(service_id).name == 'Painting'
+
+def test_resolve_services_loads_pending_services(app):
+    with app.app_context():
+        service = Service(name='Painting', price=800, time_req=8, service_type='Painting')
+        db.session.add(service)
+        db.session.flush()
+        services = resolve_services([service.id, 3, None, 99])
+        assert services[service.id] is service
+        assert services[3].name == 'Wiring'
+        assert 99 not in services
+        db.session.rollback()